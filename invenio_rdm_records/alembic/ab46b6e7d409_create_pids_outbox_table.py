@@ -0,0 +1,46 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2023 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create PIDs outbox table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "ab46b6e7d409"
+down_revision = "9e0ac518b9df"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "rdm_pids_outbox",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("recid", sa.String(length=255), nullable=False),
+        sa.Column("scheme", sa.String(length=255), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_rdm_pids_outbox")),
+        sa.UniqueConstraint("recid", "scheme", name="uq_rdm_pids_outbox_recid_scheme"),
+    )
+    op.create_index(
+        op.f("ix_rdm_pids_outbox_next_attempt"),
+        "rdm_pids_outbox",
+        ["next_attempt"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(op.f("ix_rdm_pids_outbox_next_attempt"), table_name="rdm_pids_outbox")
+    op.drop_table("rdm_pids_outbox")
@@ -0,0 +1,64 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2023 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create OAI set search indexes."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5b6c2a9e1f4"
+down_revision = "ab46b6e7d409"
+branch_labels = ()
+depends_on = "e655021de0de"
+
+COLUMNS = ("name", "spec")
+
+
+def _create_trgm_extension(bind):
+    """Create the pg_trgm extension, if allowed."""
+    try:
+        with bind.begin_nested():
+            op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        return True
+    except sa.exc.DBAPIError:
+        return False
+
+
+def upgrade():
+    """Upgrade database."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    if _create_trgm_extension(bind):
+        # Substring matches on the lowercased columns
+        for column in COLUMNS:
+            op.create_index(
+                f"ix_oaiserver_set_{column}_trgm",
+                "oaiserver_set",
+                [sa.text(f"lower({column}) gin_trgm_ops")],
+                postgresql_using="gin",
+            )
+    else:
+        # Without pg_trgm only prefix matches can use an index
+        for column in COLUMNS:
+            op.create_index(
+                f"ix_oaiserver_set_{column}_lower",
+                "oaiserver_set",
+                [sa.text(f"lower({column}) text_pattern_ops")],
+            )
+
+
+def downgrade():
+    """Downgrade database."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_oaiserver_set_{column}_trgm")
+        op.execute(f"DROP INDEX IF EXISTS ix_oaiserver_set_{column}_lower")
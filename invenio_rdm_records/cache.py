@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""In-process caches and the shared cache of search responses."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, g, request
+from invenio_access.permissions import any_user
+from invenio_cache import current_cache
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a time to live.
+
+    The cache is local to the process: changes made by other processes are
+    only seen once the entries expire.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60):
+        """Constructor.
+
+        :param maxsize: maximum number of entries, the least recently used
+            ones are evicted first.
+        :param ttl: time to live of the entries, in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        """Get the value of a key if cached and not expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Cache the value of a key."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove a key from the cache."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._data.clear()
+
+    def configure(self, maxsize, ttl):
+        """Change the size and time to live of the cache."""
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+SEARCH_GENERATION_KEY = "rdm-records:search-generation"
+"""Cache key of the counter of changes to the published records."""
+
+SEARCH_GENERATION_TIME_KEY = "rdm-records:search-generation-time"
+"""Cache key of the time of the last change to the published records."""
+
+
+def search_generation():
+    """Current generation of the published records."""
+    return current_cache.get(SEARCH_GENERATION_KEY) or 0
+
+
+def bump_search_generation():
+    """Make the cached search responses stale, after published records changed."""
+    if current_app.config["RDM_SEARCH_CACHE_ENABLED"]:
+        current_cache.inc(SEARCH_GENERATION_KEY)
+        current_cache.set(SEARCH_GENERATION_TIME_KEY, time.time())
+
+
+def _normalize(value):
+    """Normalize search arguments, e.g. the order of the selected facets."""
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return sorted((_normalize(v) for v in value), key=repr)
+    return value
+
+
+def cached_search(name):
+    """Share the responses of a search view between anonymous users.
+
+    Responses are cached by normalized query string and ``Accept`` header, in
+    the current generation of the published records, for
+    ``RDM_SEARCH_CACHE_TTL`` seconds. Changes are only visible in searches
+    once the index is refreshed: responses are not cached during
+    ``RDM_SEARCH_CACHE_REFRESH_DELAY`` seconds after a change.
+
+    :param name: the name of the search, formatted with the view arguments,
+        e.g. ``"communities/{pid_value}"``.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def inner(*args, **kwargs):
+            config = current_app.config
+            if not config["RDM_SEARCH_CACHE_ENABLED"]:
+                return f(*args, **kwargs)
+            if any(need != any_user for need in g.identity.provides):
+                return f(*args, **kwargs)
+
+            search_args = {
+                "args": request.args.to_dict(flat=False),
+                "accept": request.headers.get("Accept", ""),
+            }
+            digest = hashlib.sha1(
+                json.dumps(_normalize(search_args), sort_keys=True).encode()
+            ).hexdigest()
+            search_name = name.format(**(request.view_args or {}))
+            key = f"rdm-records:search:{search_generation()}:{search_name}:{digest}"
+            cached = current_cache.get(key)
+            if cached is not None:
+                body, status, headers = cached
+                return current_app.response_class(body, status=status, headers=headers)
+
+            changed = current_cache.get(SEARCH_GENERATION_TIME_KEY) or 0
+            refreshed = (
+                time.time() - changed >= config["RDM_SEARCH_CACHE_REFRESH_DELAY"]
+            )
+            response = f(*args, **kwargs)
+            if refreshed and response.status_code == 200:
+                current_cache.set(
+                    key,
+                    (response.get_data(), response.status_code, list(response.headers)),
+                    timeout=config["RDM_SEARCH_CACHE_TTL"],
+                )
+            return response
+
+        return inner
+
+    return decorator
@@ -11,7 +11,8 @@
 import click
 from flask import current_app
 from flask.cli import with_appcontext
-from invenio_access.permissions import system_identity
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user, system_identity
 from invenio_communities import current_communities
 from invenio_records_resources.proxies import current_service_registry
 from invenio_records_resources.services.custom_fields.errors import (
@@ -41,6 +42,10 @@ from .fixtures.tasks import (
     create_demo_record,
     get_authenticated_identity,
 )
+from .records.dumpers.profiling import instrument_record_cls, uninstrument_record_cls
+from .resources.errors import UnknownExportFormat
+from .resources.export import export_format, gzip_stream, serialize_stream
+from .services.pids import outbox, reconcile
 from .utils import get_or_create_user
 
 COMMUNITY_OWNER_EMAIL = "community@demo.org"
@@ -270,12 +275,18 @@ def invitation_requests(user_email, n_requests):
 
 
 @rdm_records.command("fixtures")
+@click.option(
+    "--bulk",
+    is_flag=True,
+    default=False,
+    help="Create the vocabularies in chunks, without background tasks.",
+)
 @with_appcontext
-def create_fixtures():
+def create_fixtures(bulk):
     """Create the fixtures required for record creation."""
     click.secho("Creating required fixtures...", fg="green")
 
-    FixturesEngine(system_identity).run()
+    FixturesEngine(system_identity, bulk=bulk).run()
 
     click.secho("Created required fixtures!", fg="green")
 
@@ -315,6 +326,201 @@ def rebuild_index():
     click.secho("Reindexed records and vocabularies!", fg="green")
 
 
+@rdm_records.command("reindex-changed")
+@click.option(
+    "-s",
+    "--since",
+    type=click.DateTime(),
+    default=None,
+    help="UTC time from which changes are reindexed. Defaults to the "
+    "start of the last successful run.",
+)
+@click.option(
+    "--check-drift",
+    is_flag=True,
+    default=False,
+    help="Compare the database and index revisions instead of reindexing.",
+)
+@click.option(
+    "--repair",
+    is_flag=True,
+    default=False,
+    help="Reindex the documents found with --check-drift.",
+)
+@with_appcontext
+def reindex_changed(since, check_drift, repair):
+    """Reindex records, drafts and parents changed since a point in time."""
+    service = current_rdm_records.records_service
+
+    if check_drift:
+        click.secho("Checking index drift...", fg="green")
+        drift = service.check_index_drift(system_identity, since=since, repair=repair)
+        for key, ids in drift.items():
+            click.secho(
+                f"{len(ids)} {key} out of sync.", fg="yellow" if ids else "green"
+            )
+            for id_ in ids:
+                click.echo(id_)
+        return
+
+    click.secho(
+        f"Reindexing changes since {since or 'the last successful run'}...",
+        fg="green",
+    )
+    stats = service.reindex_changed(system_identity, since=since)
+    click.secho(
+        f"Sent {stats['records']} records and {stats['drafts']} drafts "
+        "for reindexing!",
+        fg="green",
+    )
+
+
+@rdm_records.command("profile-index")
+@click.option(
+    "-n",
+    "--sample",
+    type=int,
+    default=100,
+    show_default=True,
+    help="Number of most recently updated records to dump.",
+)
+@click.option(
+    "--drafts",
+    is_flag=True,
+    default=False,
+    help="Profile the dumping of drafts instead of published records.",
+)
+@with_appcontext
+def profile_index(sample, drafts):
+    """Measure the time spent in each dumper extension when indexing."""
+    service = current_rdm_records.records_service
+    indexer = service.draft_indexer if drafts else service.indexer
+    record_cls = indexer.record_cls
+    timings = current_rdm_records.index_timings
+    record_classes = current_rdm_records.index_record_classes()
+
+    for cls in record_classes:
+        instrument_record_cls(cls, timings)
+    timings.reset()
+    try:
+        model_cls = record_cls.model_cls
+        models = (
+            model_cls.query.filter(model_cls.is_deleted != True)  # noqa
+            .order_by(model_cls.updated.desc())
+            .limit(sample)
+        )
+        for model in models:
+            record = record_cls(model.data, model=model)
+            with timings.timed("total"):
+                indexer._prepare_record(record, indexer.record_to_index(record))
+        metrics = timings.to_dict()
+    finally:
+        if not current_app.config["RDM_INDEX_PROFILING_ENABLED"]:
+            for cls in record_classes:
+                uninstrument_record_cls(cls)
+
+    click.echo(
+        f"{'section':<50} {'calls':>8} {'total (ms)':>12} "
+        f"{'mean (ms)':>10} {'queries':>8}"
+    )
+    for name, stats in metrics.items():
+        click.echo(
+            f"{name:<50} {stats['calls']:>8} {stats['time'] * 1000:>12.2f} "
+            f"{stats['mean_time'] * 1000:>10.3f} {stats['queries']:>8}"
+        )
+
+
+@rdm_records.command("pids-outbox")
+@click.option(
+    "--process",
+    is_flag=True,
+    default=False,
+    help="Attempt the due operations before reporting the outbox depth.",
+)
+@with_appcontext
+def pids_outbox(process):
+    """Report the depth of the PIDs outbox."""
+    if process:
+        stats = outbox.process()
+        click.secho(
+            f"{stats['succeeded']} operations succeeded, {stats['failed']} failed.",
+            fg="yellow" if stats["failed"] else "green",
+        )
+
+    for key, value in outbox.metrics().items():
+        click.echo(f"{key}: {value}")
+
+
+@rdm_records.command("reconcile-pids")
+@click.option("-s", "--scheme", default="doi", show_default=True, help="PID scheme.")
+@click.option(
+    "--fix",
+    is_flag=True,
+    default=False,
+    help="Register again the PIDs registered only locally.",
+)
+@click.option("-c", "--concurrency", type=int, help="Concurrent requests.")
+@click.option("-r", "--rate", type=float, help="Maximum requests per second.")
+@with_appcontext
+def reconcile_pids(scheme, fix, concurrency, rate):
+    """Compare the status of the local PIDs with their provider."""
+    stats = reconcile.reconcile(
+        scheme=scheme, fix=fix, concurrency=concurrency, rate=rate
+    )
+    for diff in stats["differences"]:
+        click.echo(f"{diff['pid']}: local {diff['local']}, remote {diff['remote']}")
+    click.secho(
+        f"Checked {stats['checked']} PIDs: {len(stats['differences'])} "
+        f"differences, {stats['fixed']} fixed.",
+        fg="yellow" if stats["differences"] else "green",
+    )
+
+
+@rdm_records.command("export")
+@click.option(
+    "-f",
+    "--format",
+    "format_",
+    required=True,
+    help="Export format, one of the keys of RDM_EXPORT_FORMATS.",
+)
+@click.option(
+    "-s",
+    "--since",
+    type=click.DateTime(),
+    default=None,
+    help="UTC time from which updated records are exported.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("wb"),
+    default="-",
+    help="Output file, defaults to the standard output.",
+)
+@click.option(
+    "--gzip", "compress", is_flag=True, default=False, help="Compress with gzip."
+)
+@with_appcontext
+def export(format_, since, output, compress):
+    """Export all the public records in one format."""
+    try:
+        serializer, mimetype = export_format(format_)
+    except UnknownExportFormat:
+        raise click.BadParameter(f"Unknown format {format_}.", param_hint="--format")
+
+    identity = AnonymousIdentity()
+    identity.provides.add(any_user)
+    records = current_rdm_records.records_service.export(identity, since=since)
+    stream = serialize_stream(records, serializer, mimetype)
+    if compress:
+        stream = gzip_stream(stream)
+    else:
+        stream = (chunk.encode("utf-8") for chunk in stream)
+    for chunk in stream:
+        output.write(chunk)
+
+
 # CUSTOM FIELDS
 
 
@@ -37,6 +37,124 @@ RDM_RECORDS_UI_EDIT_URL = "/uploads/<pid_value>"
 RDM_ARCHIVE_DOWNLOAD_ENABLED = True
 """Flag to enable/disable the all-in-one download endpoint."""
 
+RDM_REINDEX_CHUNK_SIZE = 500
+"""Number of database rows read per chunk when reindexing changed records."""
+
+RDM_INDEXER_BULK_CHUNK_SIZE = 100
+"""Number of queued records fetched and dereferenced together by the indexer."""
+
+RDM_INDEX_RELATED_RECORDS_IN_BULK = False
+"""Reindex the other versions of a record in bulk after a change of its parent.
+
+When enabled, changes to the parent (e.g. secret links) only index the record
+and the latest version right away. The other records and drafts of the parent
+are sent to the bulk indexing queues of the records service, which must be
+processed periodically with the
+``invenio_rdm_records.services.tasks.process_bulk_queues`` task, e.g.:
+
+.. code-block:: python
+
+    CELERY_BEAT_SCHEDULE = {
+        "rdm-records-bulk-index": {
+            "task": "invenio_rdm_records.services.tasks.process_bulk_queues",
+            "schedule": timedelta(minutes=1),
+        },
+    }
+"""
+
+RDM_INDEX_PROFILING_ENABLED = False
+"""Measure the time spent in each dumper extension and system field hook.
+
+The measurements are available from ``current_rdm_records.index_timings``.
+"""
+
+RDM_PIDS_OUTBOX_ENABLED = False
+"""Queue the PID registrations and updates of published records in an outbox.
+
+The outbox is drained by the ``process_pids_outbox`` Celery task, which has
+to be scheduled in ``CELERY_BEAT_SCHEDULE``. Otherwise, one task registering
+or updating the PID is sent per published record and scheme.
+"""
+
+RDM_PIDS_OUTBOX_RATE = 5
+"""Maximum number of outbox operations sent per second by a worker."""
+
+RDM_PIDS_OUTBOX_BATCH_SIZE = 100
+"""Maximum number of outbox operations attempted per task run."""
+
+RDM_PIDS_OUTBOX_MAX_ATTEMPTS = 10
+"""Number of attempts after which an outbox operation is given up."""
+
+RDM_PIDS_OUTBOX_BACKOFF = 30
+"""Delay in seconds before retrying a failed operation, doubled per failure."""
+
+RDM_PIDS_OUTBOX_MAX_BACKOFF = 6 * 60 * 60
+"""Maximum delay in seconds before retrying a failed operation."""
+
+RDM_PIDS_OUTBOX_CIRCUIT_THRESHOLD = 5
+"""Number of consecutive failures after which the outbox stops draining."""
+
+RDM_PIDS_OUTBOX_CIRCUIT_COOLDOWN = 5 * 60
+"""Time in seconds before draining again after too many failures."""
+
+RDM_PIDS_RECONCILE_CONCURRENCY = 4
+"""Number of concurrent requests when reconciling PIDs with their provider."""
+
+RDM_PIDS_RECONCILE_RATE = 10
+"""Maximum number of requests per second when reconciling PIDs."""
+
+RDM_PIDS_RECONCILE_CHUNK_SIZE = 100
+"""Number of local PIDs loaded at once when reconciling PIDs."""
+
+RDM_SERVICE_TRACING_SAMPLE_RATE = 0
+"""Share (0 to 1) of records service actions whose components are traced.
+
+Traced runs log the time and queries of each component, which are also
+aggregated in ``current_rdm_records.records_service.component_timings``.
+"""
+
+RDM_VOCABULARY_REFERENCES = {
+    "affiliations": [
+        "metadata.creators.affiliations.id",
+        "metadata.contributors.affiliations.id",
+    ],
+    "awards": ["metadata.funding.award.id"],
+    "contributorsroles": ["metadata.contributors.role.id"],
+    "creatorsroles": ["metadata.creators.role.id"],
+    "datetypes": ["metadata.dates.type.id"],
+    "descriptiontypes": ["metadata.additional_descriptions.type.id"],
+    "funders": ["metadata.funding.funder.id"],
+    "languages": [
+        "metadata.languages.id",
+        "metadata.additional_titles.lang.id",
+        "metadata.additional_descriptions.lang.id",
+    ],
+    "licenses": ["metadata.rights.id"],
+    "relationtypes": ["metadata.related_identifiers.relation_type.id"],
+    "resourcetypes": [
+        "metadata.resource_type.id",
+        "metadata.related_identifiers.resource_type.id",
+    ],
+    "subjects": ["metadata.subjects.id"],
+    "titletypes": ["metadata.additional_titles.type.id"],
+}
+"""Search fields of records and drafts that reference vocabulary entries.
+
+Maps a vocabulary type to the indexed fields holding the ids of its entries.
+It is used to find the records and drafts to reindex when a vocabulary entry
+changes. Custom fields referencing vocabularies can be added here as well.
+"""
+
+RDM_VOCABULARY_REFERENCES_REINDEX = True
+"""Reindex the records and drafts referencing a vocabulary entry when it changes.
+
+Adds the ``VocabularyReferencesComponent`` to the services of the generic
+vocabularies, affiliations, awards, funders and subjects.
+"""
+
+RDM_VOCABULARIES_BULK_CHUNK_SIZE = 1000
+"""Number of vocabulary entries created per transaction by the bulk loader."""
+
 #: Default site URL (used only when not in a context - e.g. like celery tasks).
 THEME_SITEURL = "http://127.0.0.1:5000"
 
@@ -112,6 +230,17 @@ RDM_RECORDS_REVIEWS = [
     "community-submission",
 ]
 
+RDM_REVIEW_BULK_CHUNK_SIZE = 50
+"""Number of review requests accepted or declined per database transaction."""
+
+RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH = False
+"""Publish the records of accepted community submissions in the background.
+
+When enabled, accepting a submission only adds the community to the record
+and closes the request. The draft is then published by a task, which adds a
+comment to the request if the publication fails.
+"""
+
 #
 # Search configuration
 #
@@ -233,6 +362,68 @@ RDM_SEARCH_VERSIONING = {
 }
 """Records versions search configuration (list of versions for a record)."""
 
+RDM_SEARCH_CACHE_ENABLED = False
+"""Cache the responses of the records searches made by anonymous users.
+
+The responses are stored in the shared cache. They become stale when
+published records are indexed (the generation of the published records is
+bumped) or after ``RDM_SEARCH_CACHE_TTL``.
+"""
+
+RDM_SEARCH_CACHE_TTL = 60
+"""Seconds during which a cached search response can be served."""
+
+RDM_SEARCH_CACHE_REFRESH_DELAY = 2
+"""Seconds after a change to the published records without caching searches.
+
+Changes are only visible in searches after the refresh of the index (every
+second by default). Responses made in the meantime are not cached, as they
+might not include the change yet.
+"""
+
+RDM_EXPORT_FORMATS = {
+    "json": "application/json",
+    "csl-json": "application/vnd.citationstyles.csl+json",
+    "datacite-json": "application/vnd.datacite.datacite+json",
+    "datacite-xml": "application/vnd.datacite.datacite+xml",
+    "dublincore": "application/x-dc+xml",
+}
+"""Formats of the full export of the records and their serializer mimetype.
+
+JSON formats are exported as newline-delimited JSON, XML formats as a single
+XML document whose root element wraps the records.
+"""
+
+RDM_EXPORT_CHUNK_SIZE = 500
+"""Number of records fetched per search request when exporting."""
+
+RDM_PERMISSION_FILTERS_CACHE_SIZE = 1024
+"""Maximum number of cached permission filters of searches (per process)."""
+
+RDM_PERMISSION_FILTERS_CACHE_TTL = 60
+"""Time to live, in seconds, of the cached permission filters of searches.
+
+The filters are cached per action and set of needs of the identity, so a
+change of roles or community memberships is seen right away. Only changes to
+the configured community roles and superusers wait for the expiration.
+"""
+
+RDM_COMMUNITY_IDS_CACHE_SIZE = 4096
+"""Maximum number of community ids and slugs cached for community searches."""
+
+RDM_COMMUNITY_IDS_CACHE_TTL = 300
+"""Seconds after which the existence of a community is checked again.
+
+Deleting or renaming a community clears it from the cache of the process
+making the change, other processes see it once the entry expires.
+"""
+
+RDM_EXPAND_COMMUNITIES_CACHE_SIZE = 1024
+"""Maximum number of public communities cached for expanding results."""
+
+RDM_EXPAND_COMMUNITIES_CACHE_TTL = 30
+"""Seconds during which a public community is reused for expanding results."""
+
 #
 # OAI-PMH Search configuration
 #
@@ -264,6 +455,51 @@ RDM_OAI_PMH_SEARCH = {
 }
 """OAI-PMH search configuration."""
 
+RDM_OAI_PMH_SETS_SEARCH_PREFIX = False
+"""Match the OAI sets search query as a prefix of the set names and specs.
+
+By default the query can appear anywhere in them, which is only fast with
+the ``pg_trgm`` indexes. Enable it when the extension is not available,
+as prefix matches can use the fallback indexes.
+"""
+
+RDM_OAI_PMH_SETS_CACHE_SIZE = 1024
+"""Maximum number of OAI sets cached in each process for set reads."""
+
+RDM_OAI_PMH_SETS_CACHE_TTL = 60
+"""Seconds after which a cached OAI set is read again from the database.
+
+Changes through the OAI-PMH service clear the cache of the process making
+them, other processes see them once their cached sets expire.
+"""
+
+RDM_OAI_PMH_PRECOMPUTED_SETS = False
+"""Store the specs of the OAI sets of the records in their documents.
+
+The sets are matched when indexing, with the percolator. Set the following
+to harvest sets with a term filter on the stored specs:
+
+.. code-block:: python
+
+    OAISERVER_SET_RECORDS_QUERY_FETCHER = (
+        "invenio_rdm_records.oai:set_records_query_fetcher"
+    )
+    OAISERVER_RECORD_SETS_FETCHER = "invenio_rdm_records.oai:find_sets_for_record"
+
+Changing a set through the OAI-PMH service reindexes its records in the
+background. The specs are stored in the ``oai_sets`` field of the
+``record-v6.0.0`` mapping: the records index has to be migrated to it before
+enabling this.
+"""
+
+RDM_OAI_PMH_SEARCH_AFTER = False
+"""Paginate ListRecords and ListIdentifiers with ``search_after``.
+
+Requires ``OAISERVER_SEARCH_CLS`` to be ``OAIRecordSearch`` (or a subclass).
+The cursor is kept in the resumption token instead of a scroll context, so
+``OAISERVER_RESUMPTION_TOKEN_EXPIRE_TIME`` can safely be raised to hours.
+"""
+
 #
 # Persistent identifiers configuration
 #
@@ -370,6 +606,25 @@ This is only required if you want your records to be harvestable (OAI-PMH)
 in DataCite XML format.
 """
 
+DATACITE_TIMEOUT = (5, 30)
+"""Connect and read timeouts in seconds of the requests to DataCite.
+
+A single number sets both timeouts.
+"""
+
+DATACITE_POOL_SIZE = 10
+"""Maximum number of kept-alive connections to DataCite per worker process."""
+
+DATACITE_RETRIES = 3
+"""Number of retries of a request to DataCite.
+
+Connection errors, rate limiting (HTTP 429) and server errors (HTTP 5xx) of
+idempotent requests (e.g. updates) are retried.
+"""
+
+DATACITE_RETRY_BACKOFF = 0.5
+"""Backoff factor in seconds between the retries of a request to DataCite."""
+
 #
 # Custom fields
 #
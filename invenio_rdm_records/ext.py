@@ -22,11 +22,14 @@ from itsdangerous import SignatureExpired
 
 from invenio_rdm_records.oaiserver.resources.config import OAIPMHServerResourceConfig
 from invenio_rdm_records.oaiserver.resources.resources import OAIPMHServerResource
+from invenio_rdm_records.oaiserver.services.cache import oai_sets_cache
 from invenio_rdm_records.oaiserver.services.config import OAIPMHServerServiceConfig
 from invenio_rdm_records.oaiserver.services.services import OAIPMHServerService
 
 from . import config
 from .customizations import load_class
+from .profiling import Timings
+from .records.dumpers.profiling import instrument_record_cls
 from .resources import (
     IIIFResource,
     IIIFResourceConfig,
@@ -46,7 +49,11 @@ from .services import (
     RDMRecordServiceConfig,
     SecretLinkService,
 )
+from .services.communities import community_ids_cache, register_community_listeners
+from .services.components import VocabularyReferencesComponent
+from .services.permissions import query_filters_cache
 from .services.pids import PIDManager, PIDsService
+from .services.results import communities_reader
 from .services.review.service import ReviewService
 
 
@@ -101,6 +108,9 @@ class InvenioRDMRecords(object):
         self.init_config(app)
         self.init_services(app)
         self.init_resource(app)
+        self.init_profiling(app)
+        self.init_caches(app)
+        self.init_oai(app)
         app.before_request(verify_token)
         app.extensions["invenio-rdm-records"] = self
         app.register_blueprint(blueprint)
@@ -393,6 +403,91 @@ class InvenioRDMRecords(object):
             config=resource_configs.iiif,
         )
 
+    def init_profiling(self, app):
+        """Initialize the timing instrumentation of the indexing dumpers."""
+        self.index_timings = Timings()
+        if app.config["RDM_INDEX_PROFILING_ENABLED"]:
+            for record_cls in self.index_record_classes():
+                instrument_record_cls(record_cls, self.index_timings)
+
+    def init_caches(self, app):
+        """Initialize the in-process caches."""
+        oai_sets_cache.configure(
+            app.config["RDM_OAI_PMH_SETS_CACHE_SIZE"],
+            app.config["RDM_OAI_PMH_SETS_CACHE_TTL"],
+        )
+        communities_reader.cache.configure(
+            app.config["RDM_EXPAND_COMMUNITIES_CACHE_SIZE"],
+            app.config["RDM_EXPAND_COMMUNITIES_CACHE_TTL"],
+        )
+        community_ids_cache.configure(
+            app.config["RDM_COMMUNITY_IDS_CACHE_SIZE"],
+            app.config["RDM_COMMUNITY_IDS_CACHE_TTL"],
+        )
+        query_filters_cache.configure(
+            app.config["RDM_PERMISSION_FILTERS_CACHE_SIZE"],
+            app.config["RDM_PERMISSION_FILTERS_CACHE_TTL"],
+        )
+        register_community_listeners()
+
+    def init_oai(self, app):
+        """Initialize the OAI-PMH harvesting functions."""
+        # The OAI-PMH responses import these functions by name
+        from invenio_oaiserver import response
+
+        from . import oai
+
+        if app.config["RDM_OAI_PMH_SEARCH_AFTER"]:
+            response.get_records = oai.get_records
+        if app.config["RDM_OAI_PMH_PRECOMPUTED_SETS"]:
+            response.sets_search_all = oai.sets_search_all
+
+    def init_vocabularies(self, app):
+        """Reindex the records referencing vocabulary entries when they change.
+
+        The vocabularies services are given a config subclass with the
+        component, so that the config classes of Invenio-Vocabularies are
+        left untouched. Called once all the extensions are loaded.
+        """
+        if not app.config["RDM_VOCABULARY_REFERENCES_REINDEX"]:
+            return
+
+        vocabularies = app.extensions.get("invenio-vocabularies")
+        if vocabularies is None:
+            return
+        for name in (
+            "service",
+            "affiliations_service",
+            "awards_service",
+            "funders_service",
+            "subjects_service",
+        ):
+            service = getattr(vocabularies, name, None)
+            if service is None:
+                continue
+            service_config = service.config
+            if VocabularyReferencesComponent in service_config.components:
+                continue
+            service.config = type(
+                service_config.__name__,
+                (service_config,),
+                {
+                    "components": [
+                        *service_config.components,
+                        VocabularyReferencesComponent,
+                    ]
+                },
+            )
+
+    def index_record_classes(self):
+        """Record classes dumped when indexing records and drafts."""
+        service = self.records_service
+        return (
+            service.record_cls,
+            service.draft_cls,
+            service.record_cls.parent_record_cls,
+        )
+
     def fix_datacite_configs(self, app):
         """Make sure that the DataCite config items are strings."""
         datacite_config_items = [
@@ -404,3 +499,8 @@ class InvenioRDMRecords(object):
         for config_item in datacite_config_items:
             if config_item in app.config:
                 app.config[config_item] = str(app.config[config_item])
+
+
+def finalize_app(app):
+    """Finalize the application, once all the extensions are loaded."""
+    app.extensions["invenio-rdm-records"].init_vocabularies(app)
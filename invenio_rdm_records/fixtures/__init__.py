@@ -27,9 +27,10 @@ class FixturesEngine:
     types of data from vocabularies, access control and records.
     """
 
-    def __init__(self, identity):
+    def __init__(self, identity, bulk=False):
         """Initialize the class."""
         self._identity = identity
+        self._bulk = bulk
 
     def run(self):
         """Run the fixture loading."""
@@ -42,6 +43,7 @@ class FixturesEngine:
             app_data_folder=app_data_folder,
             pkg_data_folder=data_folder,
             filename="vocabularies.yaml",
+            bulk=self._bulk,
         ).load()
 
         UsersFixture(
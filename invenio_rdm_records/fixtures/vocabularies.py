@@ -11,16 +11,23 @@
 import csv
 import json
 from collections import defaultdict
+from itertools import islice
 from os.path import splitext
 from pathlib import Path
 
 import pkg_resources
 import yaml
+from flask import current_app
 from invenio_db import db
+from invenio_records_resources.proxies import current_service_registry
+from invenio_records_resources.services.uow import RecordCommitOp, UnitOfWork
+from invenio_search.engine import search
 from invenio_vocabularies.proxies import current_service
 from invenio_vocabularies.records.models import VocabularyScheme, VocabularyType
+from marshmallow import ValidationError
 from sqlalchemy.orm import load_only
 
+from ..services.indexer import RelationsCache, index_action
 from .tasks import create_vocabulary_record
 
 
@@ -96,6 +103,132 @@ def create_iterator(data_file):
     raise RuntimeError(f"Unknown data format: {ext}")
 
 
+#
+# Bulk loading
+#
+class BulkVocabularyLoader:
+    """Create the records of a vocabulary in chunks.
+
+    The entries of a chunk are validated with the schema of the service and
+    created with its components in a single transaction. The relations they
+    share are resolved once per chunk, and the records of a chunk are indexed
+    with a single bulk request.
+    """
+
+    def __init__(self, service, identity, chunk_size=None):
+        """Constructor."""
+        self._service = service
+        self._identity = identity
+        self._chunk_size = (
+            chunk_size or current_app.config["RDM_VOCABULARIES_BULK_CHUNK_SIZE"]
+        )
+
+    def load(self, entries):
+        """Create the records of the entries.
+
+        Invalid entries are logged and skipped.
+
+        :returns: a dictionary with the number of ``created`` records and of
+            ``errors``.
+        """
+        self._service.require_permission(self._identity, "create")
+        stats = {"created": 0, "errors": 0}
+        iterator = iter(entries)
+        while True:
+            chunk = list(islice(iterator, self._chunk_size))
+            if not chunk:
+                break
+            self._load_chunk(chunk, stats)
+        return stats
+
+    def _validate(self, chunk, stats):
+        """Validate the entries of a chunk, skipping the invalid ones."""
+        valid = []
+        for data in chunk:
+            try:
+                data, _ = self._service.schema.load(
+                    data, context={"identity": self._identity}
+                )
+            except ValidationError as e:
+                current_app.logger.warning(
+                    f"Invalid vocabulary entry {data.get('id')}: {e.messages}"
+                )
+                stats["errors"] += 1
+                continue
+            valid.append(data)
+        return valid
+
+    def _prefetch(self, entries):
+        """Resolve the relations of all the entries of a chunk at once."""
+        record_cls = self._service.record_cls
+        cache = RelationsCache()
+        try:
+            cache.prefetch([record_cls(dict(data)) for data in entries])
+        except Exception:
+            # Relations are resolved one by one when the chunk can't be prefetched
+            current_app.logger.warning(
+                "Failed to prefetch relations for a chunk of vocabulary entries",
+                exc_info=True,
+            )
+        return cache
+
+    def _create(self, entries, cache, stats):
+        """Create the records of a chunk in a single transaction.
+
+        :returns: the search engine actions indexing the created records.
+        """
+        service = self._service
+        actions = []
+        with UnitOfWork(db.session) as uow:
+            for data in entries:
+                try:
+                    with db.session.begin_nested():
+                        record = service.record_cls.create({})
+                        cache.inject(record)
+                        service.run_components(
+                            "create",
+                            self._identity,
+                            data=data,
+                            record=record,
+                            errors=[],
+                            uow=uow,
+                        )
+                        uow.register(RecordCommitOp(record))
+                except Exception:
+                    current_app.logger.warning(
+                        "Failed to create a vocabulary entry", exc_info=True
+                    )
+                    stats["errors"] += 1
+                    continue
+                actions.append(index_action(service.indexer, record))
+            uow.commit()
+        return actions
+
+    def _load_chunk(self, chunk, stats):
+        """Create and index the records of a chunk."""
+        service = self._service
+        entries = self._validate(chunk, stats)
+        cache = self._prefetch(entries)
+        try:
+            actions = self._create(entries, cache, stats)
+        finally:
+            cache.restore()
+        stats["created"] += len(actions)
+
+        if actions:
+            _, errors = search.helpers.bulk(
+                service.indexer.client,
+                actions,
+                stats_only=True,
+                raise_on_error=False,
+                request_timeout=current_app.config["INDEXER_BULK_REQUEST_TIMEOUT"],
+            )
+            if errors:
+                current_app.logger.warning(
+                    f"Failed to index {errors} vocabulary entries"
+                )
+
+
 #
 # Exceptions
 #
@@ -135,6 +268,7 @@ class PrioritizedVocabulariesFixtures:
         pkg_data_folder=None,
         filename="vocabularies.yaml",
         delay=True,
+        bulk=False,
     ):
         """Constructor.
 
@@ -144,6 +278,8 @@ class PrioritizedVocabulariesFixtures:
                          Defaults to `./data` and really only changeable for
                          tests.
         filename: vocabularies filename to check at each location
+        bulk: create the records in chunks, synchronously (see
+              ``BulkVocabularyLoader``)
         """
         self._identity = identity
         # Path("./app_data") assumes app_data is in current working directory
@@ -151,6 +287,7 @@ class PrioritizedVocabulariesFixtures:
         self._pkg_data_folder = pkg_data_folder or Path(__file__).parent / "data"
         self._filename = filename
         self._delay = delay
+        self._bulk = bulk
         self._loaded_vocabularies = set()
 
     def _entry_points(self):
@@ -242,7 +379,9 @@ class PrioritizedVocabulariesFixtures:
 
     def load_vocabularies(self, filepath):
         """Load vocabularies listed in vocabularies file."""
-        fixture = VocabulariesFixture(self._identity, filepath, delay=self._delay)
+        fixture = VocabulariesFixture(
+            self._identity, filepath, delay=self._delay, bulk=self._bulk
+        )
         self._loaded_vocabularies = fixture.load(ignore=self._loaded_vocabularies)
 
 
@@ -253,11 +392,12 @@ class VocabulariesFixture:
     vocabularies file.
     """
 
-    def __init__(self, identity, filepath, delay=True):
+    def __init__(self, identity, filepath, delay=True, bulk=False):
         """Initialize the fixture."""
         self._identity = identity
         self._filepath = filepath
         self._delay = delay
+        self._bulk = bulk
 
     def read(self):
         """Return content of vocabularies file."""
@@ -296,7 +436,11 @@ class VocabulariesFixture:
         ids = set(ignore) if ignore else set()
 
         for id_, entry in self.read():
-            ids.update(entry.load(self._identity, ignore=ids, delay=self._delay))
+            ids.update(
+                entry.load(
+                    self._identity, ignore=ids, delay=self._delay, bulk=self._bulk
+                )
+            )
 
         return ids
 
@@ -335,12 +479,16 @@ class VocabularyEntry:
         """Vocabularies actually loaded."""
         return [self._id]
 
-    def load(self, identity, ignore=None, delay=False):
+    def load(self, identity, ignore=None, delay=False, bulk=False):
         """Template method design pattern for loading entries."""
         ignore = ignore or set()
         self.pre_load(identity, ignore=ignore)
-        for data in self.iterate(ignore=ignore):
-            self.create_record(data, delay=delay)
+        if bulk:
+            service = current_service_registry.get(self.service_str)
+            BulkVocabularyLoader(service, identity).load(self.iterate(ignore=ignore))
+        else:
+            for data in self.iterate(ignore=ignore):
+                self.create_record(data, delay=delay)
         return self.loaded()
 
     def create_record(self, data, delay=False):
@@ -8,8 +8,15 @@
 
 """Invenio-RDM-Records OAI Functionality."""
 
+import json
+from datetime import datetime
+
 from datacite import schema43
 from flask import current_app, g
+from invenio_oaiserver import current_oaiserver, fetchers, percolator
+from invenio_oaiserver import query as oaiserver_query
+from invenio_oaiserver.errors import OAINoRecordsMatchError
+from invenio_oaiserver.models import OAISet
 from invenio_pidstore.errors import PersistentIdentifierError, PIDDoesNotExistError
 from invenio_pidstore.fetchers import FetchedPID
 from invenio_pidstore.models import PersistentIdentifier
@@ -92,8 +99,63 @@ def oaiid_fetcher(record_uuid, data):
     )
 
 
-def getrecord_fetcher(record_id):
-    """Fetch record data as dict with identity check for serialization."""
+def set_records_query_fetcher(spec):
+    """Query of the records of a set, using the precomputed set specs.
+
+    To be used as ``OAISERVER_SET_RECORDS_QUERY_FETCHER``.
+    """
+    if not current_app.config["RDM_OAI_PMH_PRECOMPUTED_SETS"]:
+        return fetchers.set_records_query_fetcher(spec)
+    return dsl.Q("term", oai_sets=spec)
+
+
+def sets_search_all(records):
+    """Get the set specs of many records, as stored in their documents.
+
+    Records indexed without precomputed sets are matched with the percolator,
+    all in a single query.
+    """
+    if not current_app.config["RDM_OAI_PMH_PRECOMPUTED_SETS"]:
+        return percolator.sets_search_all(records)
+    sets = [record.get("oai_sets") for record in records]
+    missing = [i for i, specs in enumerate(sets) if specs is None]
+    if missing:
+        matched = percolator.sets_search_all([records[i] for i in missing])
+        for i, specs in zip(missing, matched):
+            sets[i] = specs
+    return sets
+
+
+def find_sets_for_record(record):
+    """Get the set specs of a record.
+
+    To be used as ``OAISERVER_RECORD_SETS_FETCHER``.
+    """
+    return sets_search_all([record])[0]
+
+
+def reindex_set_records(spec):
+    """Reindex the records entering or leaving a set.
+
+    These are the records currently stored with the set spec and the records
+    matching the current query of the set (if it still exists).
+    """
+    query = dsl.Q("term", oai_sets=spec)
+    oai_set = OAISet.query.filter_by(spec=spec).one_or_none()
+    if oai_set is not None and oai_set.search_pattern:
+        query |= dsl.Q(oaiserver_query.query_string_parser(oai_set.search_pattern))
+
+    service = current_rdm_records.records_service
+    search = (
+        RecordsSearch(index=service.record_cls.index.search_alias)
+        .filter(query)
+        .source(False)
+    )
+    service.indexer.bulk_index(hit.meta.id for hit in search.scan())
+
+
+def _read_record(record_id):
+    """Read a record through the service, checking the identity's access."""
     recid = PersistentIdentifier.get_by_object(
         pid_type="recid", object_uuid=record_id, object_type="rec"
     )
@@ -107,6 +169,30 @@ def getrecord_fetcher(record_id):
     return result.to_dict()
 
 
+def getrecords_fetcher(record_ids):
+    """Fetch the data of many records as dicts for serialization.
+
+    Public records are read from the search index with a single query, as in
+    ``ListRecords``. Only the other ones are read through the service, with
+    the identity check.
+
+    :returns: a list of the records data, in the order of the record ids.
+    """
+    ids = [str(record_id) for record_id in record_ids]
+    search = OAIRecordSearch(index=current_app.config["OAISERVER_RECORD_INDEX"])
+    hits = search.filter("ids", values=ids)[0 : len(ids)].execute()
+    sources = {hit.meta.id: hit.to_dict() for hit in hits}
+    return [
+        sources[record_id] if record_id in sources else _read_record(record_id)
+        for record_id in ids
+    ]
+
+
+def getrecord_fetcher(record_id):
+    """Fetch record data as dict with identity check for serialization."""
+    return getrecords_fetcher([record_id])[0]
+
+
 class OAIRecordSearch(RecordsSearch):
     """Define default filter for quering OAI server."""
 
@@ -117,3 +203,92 @@ class OAIRecordSearch(RecordsSearch):
             dsl.Q("exists", field="pids.oai.identifier"),
             dsl.Q("term", **{"access.record": "public"}),
         ]
+
+    def sorted_after(self, cursor=None):
+        """Sort on ``(updated, id)`` and start after the given sort values.
+
+        Unlike ``from``/``size`` pagination, the cost of a page does not grow
+        with its depth and no search context is kept between requests.
+        """
+        search = self.sort(
+            {current_oaiserver.last_update_key: {"order": "asc"}},
+            {"id": {"order": "asc"}},
+        )
+        if cursor:
+            search = search.extra(search_after=cursor)
+        return search
+
+
+class SearchAfterPagination:
+    """Page of OAI-PMH records fetched with ``search_after``.
+
+    The sort values of the last hit are exposed as ``_scroll_id``, so that
+    invenio-oaiserver stores them in the signed resumption token.
+    """
+
+    def __init__(self, response, page, per_page):
+        """Constructor."""
+        self.response = response
+        self.page = page
+        self.per_page = per_page
+        self.total = response["hits"]["total"]["value"]
+        if self.total == 0:
+            raise OAINoRecordsMatchError()
+        hits = response["hits"]["hits"]
+        self.has_next = len(hits) == per_page and page * per_page < self.total
+        self.next_num = page + 1 if self.has_next else None
+        self._scroll_id = json.dumps(hits[-1]["sort"]) if self.has_next else None
+
+    @property
+    def items(self):
+        """Iterate over the records of the page."""
+        for result in self.response["hits"]["hits"]:
+            yield {
+                "id": result["_id"],
+                "json": result,
+                "updated": datetime.strptime(
+                    result["_source"][current_oaiserver.last_update_key][:19],
+                    "%Y-%m-%dT%H:%M:%S",
+                ),
+            }
+
+
+def get_records(**kwargs):
+    """Get a page of records for ListRecords and ListIdentifiers.
+
+    Replacement of ``invenio_oaiserver.query.get_records`` paginating with
+    ``search_after`` on ``(updated, id)`` when ``RDM_OAI_PMH_SEARCH_AFTER`` is
+    enabled. The resumption tokens then only expire after
+    ``OAISERVER_RESUMPTION_TOKEN_EXPIRE_TIME``, which can be set to hours.
+    """
+    if not current_app.config["RDM_OAI_PMH_SEARCH_AFTER"]:
+        return oaiserver_query.get_records(**kwargs)
+
+    token = kwargs.get("resumptionToken", {})
+    # The filters of resumed requests are only in the resumption token
+    kwargs = {**kwargs, **token}
+    page = token.get("page", 1)
+    size = current_app.config["OAISERVER_PAGE_SIZE"]
+    cursor = json.loads(token["scroll_id"]) if token.get("scroll_id") else None
+
+    search = (
+        current_oaiserver.search_cls(index=current_app.config["OAISERVER_RECORD_INDEX"])
+        .sorted_after(cursor)
+        .extra(version=True, track_total_hits=True)[0:size]
+    )
+    if "set" in kwargs:
+        search = search.query(
+            current_oaiserver.set_records_query_fetcher(kwargs["set"])
+        )
+
+    time_range = {}
+    if "from_" in kwargs:
+        time_range["gte"] = kwargs["from_"]
+    if "until" in kwargs:
+        time_range["lte"] = kwargs["until"]
+    if time_range:
+        search = search.filter(
+            "range", **{current_oaiserver.last_update_key: time_range}
+        )
+
+    return SearchAfterPagination(search.execute().to_dict(), page, size)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Caches of the OAI-PMH service."""
+
+from invenio_oaiserver.models import OAISet
+
+from ...cache import TTLCache
+
+oai_sets_cache = TTLCache()
+"""OAI sets by id and spec, sized with ``RDM_OAI_PMH_SETS_CACHE_*``."""
+
+
+def cache_oai_set(oai_set):
+    """Cache a copy of an OAI set, detached from any database session.
+
+    :returns: the cached copy.
+    """
+    copy = OAISet(**{c.key: getattr(oai_set, c.key) for c in OAISet.__table__.c})
+    oai_sets_cache.set(("id", oai_set.id), copy)
+    oai_sets_cache.set(("spec", oai_set.spec), copy)
+    return copy
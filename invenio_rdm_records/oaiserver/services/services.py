@@ -18,17 +18,24 @@ from invenio_records_resources.services.base import LinksTemplate
 from invenio_records_resources.services.records.schema import ServiceSchemaWrapper
 from invenio_records_resources.services.uow import unit_of_work
 from marshmallow import ValidationError
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 from sqlalchemy.orm.exc import NoResultFound
-from sqlalchemy.sql import text
 
+from invenio_rdm_records.oaiserver.services.cache import (
+    cache_oai_set,
+    oai_sets_cache,
+)
 from invenio_rdm_records.oaiserver.services.errors import (
     OAIPMHSetDoesNotExistError,
     OAIPMHSetIDDoesNotExistError,
     OAIPMHSetNotEditable,
     OAIPMHSetSpecAlreadyExistsError,
 )
-from invenio_rdm_records.oaiserver.services.uow import OAISetCommitOp, OAISetDeleteOp
+from invenio_rdm_records.oaiserver.services.uow import (
+    OAISetCommitOp,
+    OAISetDeleteOp,
+    OAISetRecordsIndexOp,
+)
 
 
 class OAIPMHServerService(Service):
@@ -38,6 +45,7 @@ class OAIPMHServerService(Service):
         """Init service with config."""
         super().__init__(config)
         self.reserved_prefixes = config.reserved_prefixes.union(extra_reserved_prefixes)
+        self._formats = None
 
     @property
     def schema(self):
@@ -51,8 +59,22 @@ class OAIPMHServerService(Service):
             self.config.links_item,
         )
 
-    def _get_one(self, raise_error=True, **kwargs):
-        """Retrieve set based on provided arguments."""
+    def _get_one(self, raise_error=True, cached=False, **kwargs):
+        """Retrieve set based on provided arguments.
+
+        :param cached: get a copy of the set from the cache, looked up by
+            ``id`` or ``spec``. The copy must not be modified.
+        """
+        if cached and len(kwargs) == 1:
+            [key] = kwargs.items()
+            oai_set = oai_sets_cache.get(key)
+            if oai_set is None:
+                oai_set, errors = self._get_one(raise_error=raise_error, **kwargs)
+                if oai_set is not None:
+                    oai_set = cache_oai_set(oai_set)
+                return oai_set, errors
+            return oai_set, []
+
         set = None
         errors = []
         try:
@@ -107,6 +129,7 @@ class OAIPMHServerService(Service):
             raise OAIPMHSetSpecAlreadyExistsError(new_set.spec)
 
         uow.register(OAISetCommitOp(new_set))
+        self._reindex_set_records(uow, new_set.spec)
         return self.result_item(
             service=self,
             identity=identity,
@@ -117,7 +140,7 @@ class OAIPMHServerService(Service):
     def read(self, identity, id_):
         """Read the OAI set."""
         self.require_permission(identity, "read")
-        oai_set, errors = self._get_one(id=id_)
+        oai_set, errors = self._get_one(cached=True, id=id_)
 
         return self.result_item(
             service=self,
@@ -136,18 +159,33 @@ class OAIPMHServerService(Service):
         filters = []
 
         if query_param:
+            # Lowercased LIKE, to use the indexes on lower(name) and lower(spec)
+            query_param = query_param.lower()
+            if current_app.config["RDM_OAI_PMH_SETS_SEARCH_PREFIX"]:
+                match = "startswith"
+            else:
+                match = "contains"
             filters.extend(
                 [
-                    OAISet.name.ilike(f"%{query_param}%"),
-                    OAISet.spec.ilike(f"%{query_param}%"),
+                    getattr(func.lower(OAISet.name), match)(
+                        query_param, autoescape=True
+                    ),
+                    getattr(func.lower(OAISet.spec), match)(
+                        query_param, autoescape=True
+                    ),
                 ]
             )
 
+        sort_direction = search_params["sort_direction"]
+        order_by = [
+            sort_direction(getattr(OAISet, field)) for field in search_params["sort"]
+        ]
+        # Stable pagination between sets with the same sort values
+        order_by.append(sort_direction(OAISet.id))
+
         oai_sets = (
             OAISet.query.filter(or_(*filters))
-            .order_by(
-                search_params["sort_direction"](text(",".join(search_params["sort"])))
-            )
+            .order_by(*order_by)
             .paginate(
                 page=search_params["page"],
                 per_page=search_params["size"],
@@ -178,9 +216,11 @@ class OAIPMHServerService(Service):
             raise_errors=True,
         )
 
+        old_spec = oai_set.spec
         for key, value in valid_data.items():
             setattr(oai_set, key, value)
         uow.register(OAISetCommitOp(oai_set))
+        self._reindex_set_records(uow, old_spec, oai_set.spec)
 
         return self.result_item(
             service=self,
@@ -197,28 +237,39 @@ class OAIPMHServerService(Service):
         if oai_set.system_created:
             raise OAIPMHSetNotEditable(oai_set.id)
         uow.register(OAISetDeleteOp(oai_set))
+        self._reindex_set_records(uow, oai_set.spec)
 
         return True
 
+    def _reindex_set_records(self, uow, *specs):
+        """Update the sets stored in the documents of the records."""
+        if current_app.config["RDM_OAI_PMH_PRECOMPUTED_SETS"]:
+            uow.register(OAISetRecordsIndexOp(*specs))
+
     def read_all_formats(self, identity):
         """Read available metadata formats."""
         self.require_permission(identity, "read_format")
-        formats = [
-            {
-                "id": k,
-                "schema": v.get("schema", None),
-                "namespace": v.get("namespace", None),
-            }
-            for k, v in current_app.config.get("OAISERVER_METADATA_FORMATS").items()
-        ]
-
-        results = Pagination(
-            query=None,
-            page=1,
-            per_page=None,
-            total=len(formats),
-            items=formats,
-        )
+        formats_config = current_app.config.get("OAISERVER_METADATA_FORMATS")
+        # Built once per configuration
+        if self._formats is None or self._formats[0] is not formats_config:
+            formats = [
+                {
+                    "id": k,
+                    "schema": v.get("schema", None),
+                    "namespace": v.get("namespace", None),
+                }
+                for k, v in formats_config.items()
+            ]
+
+            results = Pagination(
+                query=None,
+                page=1,
+                per_page=None,
+                total=len(formats),
+                items=formats,
+            )
+            self._formats = (formats_config, results)
+        results = self._formats[1]
 
         return self.config.metadata_format_result_list_cls(
             self,
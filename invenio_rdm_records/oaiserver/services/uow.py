@@ -11,6 +11,8 @@
 from invenio_db import db
 from invenio_records_resources.services.uow import Operation
 
+from .cache import oai_sets_cache
+
 
 class OAISetCommitOp(Operation):
     """OAI-PMH set add/update operation."""
@@ -24,6 +26,10 @@ class OAISetCommitOp(Operation):
         """Add set to db session."""
         db.session.add(self._oai_set)
 
+    def on_post_commit(self, uow):
+        """Invalidate the cached sets."""
+        oai_sets_cache.clear()
+
 
 class OAISetDeleteOp(Operation):
     """OAI-PMH set delete operation."""
@@ -36,3 +42,23 @@ class OAISetDeleteOp(Operation):
     def on_register(self, uow):
         """Hard delete set."""
         db.session.delete(self._oai_set)
+
+    def on_post_commit(self, uow):
+        """Invalidate the cached sets."""
+        oai_sets_cache.clear()
+
+
+class OAISetRecordsIndexOp(Operation):
+    """Reindex in the background the records of OAI sets."""
+
+    def __init__(self, *specs):
+        """Initialize the reindex operation."""
+        super().__init__()
+        self._specs = set(specs)
+
+    def on_post_commit(self, uow):
+        """Send the reindex tasks."""
+        from invenio_rdm_records.services.tasks import reindex_oai_set_records
+
+        for spec in self._specs:
+            reindex_oai_set_records.delay(spec)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Lightweight timing and database query counting of code sections."""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_local = threading.local()
+_listening = False
+
+
+def _count_query(*args, **kwargs):
+    """Count a query executed in the current thread."""
+    _local.queries = getattr(_local, "queries", 0) + 1
+
+
+def count_queries():
+    """Start counting the database queries of all engines (idempotent)."""
+    global _listening
+    if not _listening:
+        event.listen(Engine, "before_cursor_execute", _count_query)
+        _listening = True
+
+
+def query_count():
+    """Number of queries executed so far in the current thread."""
+    return getattr(_local, "queries", 0)
+
+
+class Timings:
+    """Aggregated wall time, calls and queries of named code sections."""
+
+    def __init__(self):
+        """Constructor."""
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def add(self, name, elapsed, queries=0):
+        """Add a measurement of a section."""
+        with self._lock:
+            stats = self._stats.setdefault(
+                name, {"calls": 0, "time": 0.0, "queries": 0}
+            )
+            stats["calls"] += 1
+            stats["time"] += elapsed
+            stats["queries"] += queries
+
+    def reset(self):
+        """Drop all the measurements."""
+        with self._lock:
+            self._stats = {}
+
+    def to_dict(self):
+        """Measurements per section, the most time consuming first."""
+        with self._lock:
+            items = sorted(
+                self._stats.items(), key=lambda item: item[1]["time"], reverse=True
+            )
+            return {
+                name: {
+                    **stats,
+                    "mean_time": stats["time"] / stats["calls"],
+                }
+                for name, stats in items
+            }
+
+    @contextmanager
+    def timed(self, name):
+        """Measure the wall time and queries of the wrapped block."""
+        queries = query_count()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, query_count() - queries)
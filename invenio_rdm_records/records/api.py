@@ -36,7 +36,12 @@ from invenio_vocabularies.records.api import Vocabulary
 from invenio_vocabularies.records.systemfields.relations import CustomFieldsRelation
 
 from . import models
-from .dumpers import EDTFDumperExt, EDTFListDumperExt, GrantTokensDumperExt
+from .dumpers import (
+    EDTFDumperExt,
+    EDTFListDumperExt,
+    GrantTokensDumperExt,
+    OAISetsDumperExt,
+)
 from .systemfields import HasDraftCheckField, ParentRecordAccessField, RecordAccessField
 from .systemfields.draft_status import DraftStatus
 
@@ -86,6 +91,7 @@ class CommonFieldsMixin:
             EDTFListDumperExt("metadata.dates", "date"),
             RelationDumperExt("relations"),
             CustomFieldsDumperExt(fields_var="RDM_CUSTOM_FIELDS"),
+            OAISetsDumperExt("oai_sets"),
         ]
     )
 
@@ -272,7 +278,7 @@ class RDMRecord(CommonFieldsMixin, Record):
     model_cls = models.RDMRecordMetadata
 
     index = IndexField(
-        "rdmrecords-records-record-v5.0.0", search_alias="rdmrecords-records"
+        "rdmrecords-records-record-v6.0.0", search_alias="rdmrecords-records"
     )
 
     files = FilesField(
@@ -10,7 +10,9 @@
 from .access import GrantTokensDumperExt
 from .edtf import EDTFDumperExt, EDTFListDumperExt
 from .locations import LocationsDumper
+from .oai import OAISetsDumperExt
 from .pids import PIDsDumperExt
+from .profiling import TimedDumperExt
 
 __all__ = (
     "EDTFDumperExt",
@@ -18,4 +20,6 @@ __all__ = (
     "PIDsDumperExt",
     "GrantTokensDumperExt",
     "LocationsDumper",
+    "OAISetsDumperExt",
+    "TimedDumperExt",
 )
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Search dumper for the OAI sets of a record."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask import current_app
+from invenio_oaiserver.percolator import find_sets_for_record, sets_search_all
+from invenio_records.dumpers import SearchDumperExt
+
+_deferred_dumps = ContextVar("rdm_oai_sets_deferred_dumps", default=None)
+
+
+@contextmanager
+def deferred_oai_sets():
+    """Match the records dumped in a block with the OAI sets all at once.
+
+    The dumps are matched with a single percolation when the block exits,
+    instead of one percolation per record. If it fails, the dumps are left
+    without sets, which are then matched when harvesting.
+    """
+    dumps = []
+    token = _deferred_dumps.set(dumps)
+    try:
+        yield dumps
+    finally:
+        _deferred_dumps.reset(token)
+    if not dumps:
+        return
+    try:
+        matched = sets_search_all([data for data, _ in dumps])
+    except Exception:
+        current_app.logger.warning(
+            "Failed to match a chunk of records with the OAI sets", exc_info=True
+        )
+        return
+    for (data, key), specs in zip(dumps, matched):
+        data[key] = specs
+
+
+class OAISetsDumperExt(SearchDumperExt):
+    """Search dumper extension storing the specs of the OAI sets of a record.
+
+    The sets are matched with the percolator of invenio-oaiserver when the
+    record is indexed, so that harvesting a set is a single term filter
+    instead of running the queries of all sets. Only published records are
+    matched, when ``RDM_OAI_PMH_PRECOMPUTED_SETS`` is enabled.
+    """
+
+    def __init__(self, key="oai_sets"):
+        """Constructor.
+
+        :param key: the key where to store the set specs.
+        """
+        self.key = key
+
+    def dump(self, record, data):
+        """Dump the data."""
+        if getattr(record, "is_draft", False):
+            return
+        if not current_app.config["RDM_OAI_PMH_PRECOMPUTED_SETS"]:
+            return
+        if not data.get("pids", {}).get("oai"):
+            return
+        deferred = _deferred_dumps.get()
+        if deferred is not None:
+            deferred.append((data, self.key))
+            return
+        data[self.key] = find_sets_for_record(data)
+
+    def load(self, data, record_cls):
+        """Load the data."""
+        data.pop(self.key, None)
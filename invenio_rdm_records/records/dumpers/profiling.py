@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Timing instrumentation of the search dumpers and system field hooks."""
+
+from functools import wraps
+
+from invenio_records.dumpers import SearchDumperExt
+from invenio_records.systemfields import SystemField
+from invenio_records.systemfields.base import SystemFieldsExt
+
+from ...profiling import count_queries
+
+_HOOKS = ("pre_dump", "post_dump")
+
+
+class TimedDumperExt(SearchDumperExt):
+    """Search dumper extension measuring another extension."""
+
+    def __init__(self, ext, timings):
+        """Constructor.
+
+        :param ext: the wrapped dumper extension.
+        :param timings: the ``Timings`` where to add the measurements.
+        """
+        super().__init__()
+        self.ext = ext
+        self.timings = timings
+        self.name = f"dumper.{type(ext).__name__}"
+
+    def dump(self, record, data):
+        """Dump the data with the wrapped extension."""
+        with self.timings.timed(f"{self.name}.dump"):
+            return self.ext.dump(record, data)
+
+    def load(self, data, record_cls):
+        """Load the data with the wrapped extension."""
+        with self.timings.timed(f"{self.name}.load"):
+            return self.ext.load(data, record_cls)
+
+
+def _timed_hook(hook, name, timings):
+    """Wrap a system field hook."""
+
+    @wraps(hook)
+    def timed_hook(*args, **kwargs):
+        with timings.timed(name):
+            return hook(*args, **kwargs)
+
+    timed_hook._timed = True
+    return timed_hook
+
+
+def instrument_record_cls(record_cls, timings):
+    """Measure the dumper extensions and system field hooks of a record class.
+
+    Instrumenting is idempotent: already measured extensions and hooks are
+    kept as is. Note that dumpers and system fields shared between record
+    classes are instrumented for all of them.
+    """
+    count_queries()
+    dumper = record_cls.dumper
+    dumper._extensions = [
+        e if isinstance(e, TimedDumperExt) else TimedDumperExt(e, timings)
+        for e in dumper._extensions
+    ]
+
+    for ext in record_cls._extensions:
+        if not isinstance(ext, SystemFieldsExt):
+            continue
+        for attr_name, field in ext.declared_fields.items():
+            for hook in _HOOKS:
+                # Only the hooks that the field implements
+                if getattr(type(field), hook) is getattr(SystemField, hook):
+                    continue
+                current = getattr(field, hook)
+                if getattr(current, "_timed", False):
+                    continue
+                setattr(
+                    field,
+                    hook,
+                    _timed_hook(current, f"field.{attr_name}.{hook}", timings),
+                )
+
+
+def uninstrument_record_cls(record_cls):
+    """Remove the instrumentation of a record class."""
+    dumper = record_cls.dumper
+    dumper._extensions = [
+        e.ext if isinstance(e, TimedDumperExt) else e for e in dumper._extensions
+    ]
+
+    for ext in record_cls._extensions:
+        if not isinstance(ext, SystemFieldsExt):
+            continue
+        for field in ext.declared_fields.values():
+            for hook in _HOOKS:
+                if getattr(field.__dict__.get(hook), "_timed", False):
+                    delattr(field, hook)
@@ -7,6 +7,8 @@
 
 """Record and draft database models."""
 
+from datetime import datetime
+
 from invenio_communities.records.records.models import CommunityRelationMixin
 from invenio_db import db
 from invenio_drafts_resources.records import (
@@ -17,6 +19,7 @@ from invenio_drafts_resources.records import (
 from invenio_files_rest.models import Bucket
 from invenio_records.models import RecordMetadataBase
 from invenio_records_resources.records import FileRecordModelMixin
+from sqlalchemy_utils.models import Timestamp
 from sqlalchemy_utils.types import UUIDType
 
 
@@ -92,3 +95,53 @@ class RDMVersionsState(db.Model, ParentRecordStateMixin):
     __parent_record_model__ = RDMParentMetadata
     __record_model__ = RDMRecordMetadata
     __draft_model__ = RDMDraftMetadata
+
+
+#
+# PIDs outbox
+#
+class RDMPIDOperation(db.Model, Timestamp):
+    """Pending registration or update of a record's PID on its remote provider.
+
+    There is at most one operation per record and scheme, as a registration or
+    update always sends the latest version of the record.
+    """
+
+    __tablename__ = "rdm_pids_outbox"
+    __table_args__ = (
+        db.UniqueConstraint("recid", "scheme", name="uq_rdm_pids_outbox_recid_scheme"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    recid = db.Column(db.String(255), nullable=False)
+    """Persistent identifier of the record (i.e. its ``id``)."""
+
+    scheme = db.Column(db.String(255), nullable=False)
+    """Scheme of the PID to register or update."""
+
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    """Number of failed attempts."""
+
+    next_attempt = db.Column(
+        db.DateTime, nullable=False, default=datetime.utcnow, index=True
+    )
+    """Time after which the operation can be attempted."""
+
+    last_error = db.Column(db.Text, nullable=True)
+    """Error of the last failed attempt."""
+
+
+#
+# Incremental indexing
+#
+class RDMReindexCheckpoint(db.Model, Timestamp):
+    """Time up to which the changes of records have been reindexed."""
+
+    __tablename__ = "rdm_reindex_checkpoints"
+
+    name = db.Column(db.String(255), primary_key=True)
+    """Name of the checkpoint."""
+
+    since = db.Column(db.DateTime, nullable=False)
+    """Start time of the last successful reindexing of the changes."""
@@ -7,12 +7,20 @@
 
 """Community submission request."""
 
+from flask import current_app
 from flask_babelex import lazy_gettext as _
-from invenio_records_resources.services.uow import RecordCommitOp, RecordIndexOp
+from invenio_records_resources.services.uow import (
+    RecordCommitOp,
+    RecordIndexOp,
+    TaskOp,
+)
 from invenio_requests.customizations import actions
 
 from ..customizations import OverridableField
 from ..proxies import current_rdm_records_service as service
+from ..records.systemfields.access.field.record import AccessStatusEnum
+from ..services.errors import ReviewInconsistentAccessRestrictions
+from ..services.uow import uow_cache
 from .base import ReviewRequest
 
 
@@ -24,8 +32,21 @@ class SubmitAction(actions.SubmitAction):
 
     def execute(self, identity, uow):
         """Execute the submit action."""
-        draft = self.request.topic.resolve()
-        service._validate_draft(identity, draft)
+        # The review service hands the draft and community it resolved
+        request_id = str(self.request.id)
+        draft = uow_cache(uow, "review_topics").get(request_id)
+        if draft is None:
+            draft = self.request.topic.resolve()
+        community = uow_cache(uow, "review_receivers").get(request_id)
+        if community is None:
+            community = self.request.receiver.resolve()
+
+        community_is_restricted = community["access"]["visibility"] == "restricted"
+        record_is_restricted = draft.access.status == AccessStatusEnum.RESTRICTED
+        if community_is_restricted and not record_is_restricted:
+            raise ReviewInconsistentAccessRestrictions()
+
+        service._validate_draft(identity, draft, uow=uow)
         # Set the record's title as the request title.
         self.request["title"] = draft.metadata["title"]
         super().execute(identity, uow)
@@ -40,7 +61,6 @@ class AcceptAction(actions.AcceptAction):
         # community receivers and record topics.
         draft = self.request.topic.resolve()
         community = self.request.receiver.resolve()
-        service._validate_draft(identity, draft)
 
         # Unset review from record (still accessible from request)
         # The curator (receiver) should still have access, via the community
@@ -59,9 +79,25 @@ class AcceptAction(actions.AcceptAction):
         )
         uow.register(RecordCommitOp(draft.parent))
 
-        # Publish the record
-        # TODO: Ensure that the accpeting user has permissions to publish.
-        service.publish(identity, draft.pid.pid_value, uow=uow)
+        if current_app.config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"]:
+            from ..services.tasks import publish_accepted_submission
+
+            # The publish checks the permission and validates the draft
+            # otherwise
+            service.require_permission(identity, "publish", record=draft)
+            service._validate_draft(identity, draft, uow=uow)
+            # The accepted revision of the draft is published in the background
+            uow.register(RecordIndexOp(draft, indexer=service.indexer))
+            uow.register(
+                TaskOp(
+                    publish_accepted_submission,
+                    str(self.request.id),
+                    draft.revision_id,
+                )
+            )
+        else:
+            # Publish the record
+            service.publish(identity, draft.pid.pid_value, uow=uow)
         super().execute(identity, uow)
 
 
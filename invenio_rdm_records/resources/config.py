@@ -37,7 +37,7 @@ from ..services.errors import (
 from .args import RDMSearchRequestArgsSchema
 from .deserializers import ROCrateJSONDeserializer
 from .deserializers.errors import DeserializerError
-from .errors import HTTPJSONValidationWithMessageAsListException
+from .errors import HTTPJSONValidationWithMessageAsListException, UnknownExportFormat
 from .serializers import (
     CSLJSONSerializer,
     DataCite43JSONSerializer,
@@ -90,12 +90,16 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
     # Review
     routes["item-review"] = "/<pid_value>/draft/review"
     routes["item-actions-review"] = "/<pid_value>/draft/actions/submit-review"
+    routes["reviews-actions"] = "/reviews/actions/<action>"
     # Community records
     routes["community-records"] = "/communities/<pid_value>/records"
+    # Export
+    routes["export"] = "/export"
 
     request_view_args = {
         "pid_value": ma.fields.Str(),
         "scheme": ma.fields.Str(),
+        "action": ma.fields.Str(),
     }
 
     request_read_args = {
@@ -103,6 +107,11 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
         "locale": ma.fields.Str(),
     }
 
+    request_export_args = {
+        "format": ma.fields.Str(required=True),
+        "since": ma.fields.DateTime(),
+    }
+
     request_body_parsers = {
         "application/json": RequestBodyParser(JSONDeserializer()),
         'application/ld+json;profile="https://w3id.org/ro/crate/1.1"': RequestBodyParser(
@@ -160,6 +169,12 @@ class RDMRecordResourceConfig(RecordResourceConfig, ConfiguratorMixin):
         ValidationErrorWithMessageAsList: create_error_handler(
             lambda e: HTTPJSONValidationWithMessageAsListException(e)
         ),
+        UnknownExportFormat: create_error_handler(
+            lambda e: HTTPJSONException(
+                code=400,
+                description=_("Unknown export format: %(format)s", format=str(e)),
+            )
+        ),
     }
 
 
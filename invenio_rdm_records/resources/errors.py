@@ -20,3 +20,7 @@ class HTTPJSONValidationWithMessageAsListException(HTTPJSONException):
     def __init__(self, exception):
         """Constructor."""
         super().__init__(code=400, errors=exception.messages)
+
+
+class UnknownExportFormat(ValueError):
+    """The export format is not configured."""
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Streaming serialization of the full export of the records."""
+
+import re
+import zlib
+
+from flask import current_app
+
+from .config import record_serializers
+from .errors import UnknownExportFormat
+
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>\s*")
+
+
+def export_format(name):
+    """Get the serializer and mimetype of the stream of an export format.
+
+    :returns: a tuple ``(serializer, mimetype)``, where the mimetype is
+        ``application/x-ndjson`` for JSON formats and ``application/xml``
+        for XML formats.
+    """
+    mimetype = current_app.config["RDM_EXPORT_FORMATS"].get(name)
+    if mimetype is None:
+        raise UnknownExportFormat(name)
+    serializer = record_serializers[mimetype].serializer
+    if mimetype.endswith("xml"):
+        return serializer, "application/xml"
+    return serializer, "application/x-ndjson"
+
+
+def serialize_stream(records, serializer, mimetype):
+    """Serialize records one at a time.
+
+    JSON records are written one per line. XML records are stripped of their
+    XML declaration and wrapped in a single ``records`` element.
+    """
+    if mimetype == "application/xml":
+        yield "<?xml version='1.0' encoding='utf-8'?>\n<records>\n"
+        for record in records:
+            data = serializer.serialize_object(record)
+            yield _XML_DECLARATION.sub("", data).rstrip() + "\n"
+        yield "</records>\n"
+    else:
+        for record in records:
+            yield serializer.serialize_object(record) + "\n"
+
+
+def gzip_stream(chunks, level=6):
+    """Compress a stream of strings with gzip, without buffering it whole."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -14,7 +14,14 @@
 import datetime
 from email.utils import parsedate
 
-from flask import abort, g, request, send_file
+from flask import (
+    abort,
+    current_app,
+    g,
+    request,
+    send_file,
+    stream_with_context,
+)
 from flask_cors import cross_origin
 from flask_resources import (
     HTTPJSONException,
@@ -42,6 +49,8 @@ from invenio_records_resources.resources.records.resource import (
 from invenio_records_resources.resources.records.utils import search_preference
 from werkzeug.utils import secure_filename
 
+from ..cache import cached_search
+from .export import export_format, gzip_stream, serialize_stream
 from .serializers import (
     IIIFCanvasV2JSONSerializer,
     IIIFInfoV2JSONSerializer,
@@ -49,6 +58,8 @@ from .serializers import (
     IIIFSequenceV2JSONSerializer,
 )
 
+request_export_args = request_parser(from_conf("request_export_args"), location="args")
+
 
 class RDMRecordResource(RecordResource):
     """RDM record resource."""
@@ -69,7 +80,9 @@ class RDMRecordResource(RecordResource):
             route("PUT", p(routes["item-review"]), self.review_update),
             route("DELETE", p(routes["item-review"]), self.review_delete),
             route("POST", p(routes["item-actions-review"]), self.review_submit),
+            route("POST", p(routes["reviews-actions"]), self.reviews_bulk_action),
             route("GET", routes["community-records"], self.search_community_records),
+            route("GET", p(routes["export"]), self.export),
         ]
 
         return url_rules
@@ -127,6 +140,22 @@ class RDMRecordResource(RecordResource):
 
         return item.to_dict(), 202
 
+    @request_view_args
+    @request_data
+    @response_handler()
+    def reviews_bulk_action(self):
+        """Accept or decline many review requests at once."""
+        data = resource_requestctx.data or {}
+        comment = {"payload": data["payload"]} if data.get("payload") else None
+        results = self.service.review.bulk_execute_action(
+            g.identity,
+            resource_requestctx.view_args["action"],
+            data.get("requests", []),
+            data=comment,
+        )
+
+        return {"hits": results}, 200
+
     #
     # PIDs
     #
@@ -158,9 +187,18 @@ class RDMRecordResource(RecordResource):
 
         return item.to_dict(), 200
 
+    #
+    # Search
+    #
+    @cached_search("records")
+    def search(self):
+        """Perform a search over the items."""
+        return super().search()
+
     #
     # Community records
     #
+    @cached_search("communities/{pid_value}")
     @request_search_args
     @request_view_args
     @response_handler(many=True)
@@ -174,6 +212,30 @@ class RDMRecordResource(RecordResource):
         )
         return hits.to_dict(), 200
 
+    #
+    # Export
+    #
+    @request_export_args
+    def export(self):
+        """Stream all the records the identity can read in one format.
+
+        JSON formats are streamed as newline-delimited JSON and XML formats
+        as one XML document. The response is compressed with gzip if the
+        client accepts it.
+        """
+        args = resource_requestctx.args
+        serializer, mimetype = export_format(args["format"])
+        records = self.service.export(g.identity, since=args.get("since"))
+        stream = serialize_stream(records, serializer, mimetype)
+
+        headers = {}
+        if "gzip" in request.accept_encodings:
+            stream = gzip_stream(stream)
+            headers["Content-Encoding"] = "gzip"
+        return current_app.response_class(
+            stream_with_context(stream), mimetype=mimetype, headers=headers
+        )
+
 
 #
 # Parent Record Links
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cached lookups of communities."""
+
+from invenio_communities.communities.records.models import CommunityMetadata
+from invenio_communities.proxies import current_communities
+from sqlalchemy import event, inspect
+
+from ..cache import TTLCache
+
+community_ids_cache = TTLCache()
+"""Ids of the existing communities, by id and by slug."""
+
+
+def resolve_community_id(id_or_slug):
+    """Get the id of an existing community from its id or slug.
+
+    :raises PIDDoesNotExistError: if the community does not exist.
+    :raises PIDDeletedError: if the community is deleted.
+    """
+    key = str(id_or_slug)
+    community_id = community_ids_cache.get(key)
+    if community_id is None:
+        community = current_communities.service.record_cls.pid.resolve(key)
+        community_id = str(community.id)
+        community_ids_cache.set(key, community_id)
+    return community_id
+
+
+def _invalidate_community(mapper, connection, target):
+    """Remove an updated (e.g. deleted or renamed) community from the cache."""
+    slug_history = inspect(target).attrs.slug.history
+    for key in (str(target.id), target.slug, *(slug_history.deleted or ())):
+        if key:
+            community_ids_cache.delete(key)
+
+
+def register_community_listeners():
+    """Invalidate the cached ids when communities are deleted or renamed."""
+    for identifier in ("after_update", "after_delete"):
+        if not event.contains(CommunityMetadata, identifier, _invalidate_community):
+            event.listen(CommunityMetadata, identifier, _invalidate_community)
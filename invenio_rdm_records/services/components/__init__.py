@@ -14,6 +14,7 @@ from .metadata import MetadataComponent
 from .parent import ParentRecordAccessComponent
 from .pids import PIDsComponent
 from .review import ReviewComponent
+from .vocabularies import VocabularyReferencesComponent
 
 __all__ = (
     "AccessComponent",
@@ -22,4 +23,5 @@ __all__ = (
     "ParentRecordAccessComponent",
     "PIDsComponent",
     "ReviewComponent",
+    "VocabularyReferencesComponent",
 )
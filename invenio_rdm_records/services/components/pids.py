@@ -12,9 +12,11 @@
 
 from copy import copy
 
+from flask import current_app
 from invenio_drafts_resources.services.records.components import ServiceComponent
 from invenio_records_resources.services.uow import TaskOp
 
+from ..pids import outbox
 from ..pids.tasks import register_or_update_pid
 
 
@@ -103,9 +105,13 @@ class PIDsComponent(ServiceComponent):
         self.service.pids.pid_manager.reserve_all(draft, pids)
         record.pids = pids
 
-        # Async register/update tasks after transaction commit.
+        # Async register/update tasks after transaction commit, or operations
+        # in the outbox that are committed with the record.
         for scheme in pids.keys():
-            self.uow.register(TaskOp(register_or_update_pid, record["id"], scheme))
+            if current_app.config["RDM_PIDS_OUTBOX_ENABLED"]:
+                outbox.enqueue(record["id"], scheme)
+            else:
+                self.uow.register(TaskOp(register_or_update_pid, record["id"], scheme))
 
     def new_version(self, identity, draft=None, record=None):
         """A new draft should not have any pids from the previous record."""
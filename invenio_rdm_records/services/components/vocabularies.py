@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Vocabulary service component for reindexing referencing records."""
+
+from invenio_records_resources.services.records.components import ServiceComponent
+from invenio_records_resources.services.uow import TaskOp
+
+from ..tasks import reindex_vocabulary_references
+
+
+class VocabularyReferencesComponent(ServiceComponent):
+    """Reindex the records referencing a vocabulary entry when it changes.
+
+    Records and drafts store a copy of the titles of the vocabulary entries
+    they reference. This component is added to the components of the
+    vocabulary services (see ``RDM_VOCABULARY_REFERENCES_REINDEX``), so that
+    only the records referencing a modified entry are reindexed.
+    """
+
+    def _vocabulary_type(self, record):
+        """Vocabulary type of a record.
+
+        Generic vocabularies have a type, while specific vocabularies (e.g.
+        affiliations) have their own service.
+        """
+        type_ = getattr(record, "type", None)
+        if type_ is not None:
+            return type_.id
+        return self.service.config.service_id
+
+    def _reindex_references(self, record):
+        """Reindex the references to the record after the transaction."""
+        vocabulary_type = self._vocabulary_type(record)
+        self.uow.register(
+            TaskOp(
+                reindex_vocabulary_references,
+                vocabulary_type,
+                [record.pid.pid_value],
+            )
+        )
+
+    def update(self, identity, data=None, record=None, **kwargs):
+        """Update handler."""
+        self._reindex_references(record)
+
+    def delete(self, identity, record=None, **kwargs):
+        """Delete handler."""
+        self._reindex_references(record)
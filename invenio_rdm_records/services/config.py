@@ -52,6 +52,7 @@ from .components import (
     ReviewComponent,
 )
 from .customizations import FromConfigPIDsProviders, FromConfigRequiredPIDs
+from .indexer import RDMRecordIndexer
 from .permissions import RDMRecordPermissionPolicy
 from .result_items import SecretLinkItem, SecretLinkList
 from .schemas import RDMParentSchema, RDMRecordSchema
@@ -123,6 +124,10 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     record_cls = RDMRecord
     draft_cls = RDMDraft
 
+    # Indexers
+    indexer_cls = RDMRecordIndexer
+    draft_indexer_cls = RDMRecordIndexer
+
     # Schemas
     schema = RDMRecordSchema
     schema_parent = RDMParentSchema
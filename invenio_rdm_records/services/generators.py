@@ -168,7 +168,7 @@ class RecordOwners(Generator):
 
     def query_filter(self, identity=None, **kwargs):
         """Filters for current identity as owner."""
-        users = [n.value for n in identity.provides if n.method == "id"]
+        users = sorted({n.value for n in identity.provides if n.method == "id"})
         if users:
             return dsl.Q("terms", **{"parent.access.owned_by.user": users})
 
@@ -189,7 +189,9 @@ class SecretLinks(Generator):
 
     def query_filter(self, identity=None, **kwargs):
         """Filters for current identity secret links."""
-        secret_links = [n.value for n in identity.provides if n.method == "link"]
+        secret_links = sorted(
+            {n.value for n in identity.provides if n.method == "link"}
+        )
 
         if secret_links:
             return dsl.Q("terms", **{"parent.access.links.id": secret_links})
@@ -231,7 +233,7 @@ class CommunityAction(CommunityRoles):
         for n in identity.provides:
             if n.method == "community" and n.role in roles:
                 community_ids.add(n.value)
-        return list(community_ids)
+        return sorted(community_ids)
 
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Record indexer dereferencing relations per chunk of records."""
+
+from collections import defaultdict
+from itertools import islice
+
+from flask import current_app
+from invenio_db import db
+from invenio_indexer.api import RecordIndexer
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records_resources.records.systemfields import PIDRelation
+from invenio_records_resources.records.systemfields.pid import ModelPIDFieldContext
+from sqlalchemy.orm.exc import NoResultFound
+
+from ..cache import bump_search_generation
+from ..records.dumpers.oai import deferred_oai_sets
+
+
+#
+# Private internals of the relations of invenio-records used by the cache
+# below. They are only accessed through these functions, so that changes of
+# invenio-records need to be followed in one place.
+#
+def _pid_type(pid_field):
+    """Get the PID type of a PID field context."""
+    return getattr(pid_field, "pid_type", None) or pid_field.field._pid_type
+
+
+def _relation_fields(relations):
+    """Get the relation fields of a relations mapping, by name."""
+    return relations._fields
+
+
+def _relation_data(result):
+    """Get the stored data and value key of a relation result."""
+    return result._lookup_data(), result.field._value_key_suffix
+
+
+def _cache_key(field):
+    """Get the key of a relation field in the cache."""
+    return field._cache_key
+
+
+def _get_cache(field):
+    """Get the cache of a class-level relation field."""
+    return getattr(field, "_cache_ref", None)
+
+
+def _set_cache(field, cache, name):
+    """Set the cache of a class-level relation field."""
+    if cache is None:
+        field._cache_ref = None
+    else:
+        field.inject_cache(cache, name)
+
+
+def resolve_pids(pid_field, pid_values):
+    """Resolve many PID values of a PID field context with a single query.
+
+    :returns: A dictionary mapping each resolved PID value to its record.
+    """
+    record_cls = pid_field.record_cls
+    if isinstance(pid_field, ModelPIDFieldContext):
+        model_cls = record_cls.model_cls
+        column = getattr(model_cls, pid_field.field.model_field_name)
+        models = model_cls.query.filter(column.in_(pid_values)).all()
+        records = {
+            getattr(m, pid_field.field.model_field_name): record_cls(m.data, model=m)
+            for m in models
+        }
+    else:
+        pid_type = _pid_type(pid_field)
+        if pid_type is None:
+            return {}
+        pids = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == pid_type,
+            PersistentIdentifier.pid_value.in_(pid_values),
+            PersistentIdentifier.status == PIDStatus.REGISTERED,
+        ).all()
+        values = {pid.object_uuid: pid.pid_value for pid in pids}
+        records = {values[r.id]: r for r in record_cls.get_records(list(values.keys()))}
+
+    # Same as PIDRelation.resolve: detach the models so that accessing them
+    # after a commit does not issue new queries.
+    for record in records.values():
+        db.session.expunge(record.model)
+    return records
+
+
+def _relation_ids(result):
+    """Yield the ids referenced by a relation result not yet dereferenced."""
+    try:
+        data, key = _relation_data(result)
+    except KeyError:
+        return
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, dict) and key in item and "@v" not in item:
+            yield item[key]
+
+
+def index_action(indexer, record):
+    """Search engine bulk 'index' action of a record.
+
+    :param indexer: The indexer of the record.
+    :param record: The record to index.
+    """
+    index = indexer.record_to_index(record)
+
+    arguments = {}
+    body = indexer._prepare_record(record, index, arguments)
+    index = indexer._prepare_index(index)
+
+    action = {
+        "_op_type": "index",
+        "_index": index,
+        "_id": str(record.id),
+        "_version": record.revision_id,
+        "_version_type": indexer._version_type,
+        "_source": body,
+    }
+    action.update(arguments)
+
+    return action
+
+
+class RelationsCache:
+    """Relations cache shared by all records of a chunk.
+
+    The cache has the same layout as the one of a ``RelationsMapping`` (i.e.
+    ``{cache_key: {id: record}}``) so that it can be injected in the relation
+    fields in its place. The relation fields are shared by all the instances
+    of a record class: their previous cache must be restored once the chunk
+    is done.
+    """
+
+    def __init__(self, key="relations"):
+        """Constructor."""
+        self.key = key
+        self._cache = {}
+        self._previous = {}
+
+    def prefetch(self, records):
+        """Resolve the relations of all records with one query per relation."""
+        pending = defaultdict(set)
+        fields = {}
+        for record in records:
+            relations = getattr(record, self.key, None)
+            if relations is None:
+                continue
+            for name, field in _relation_fields(relations).items():
+                if not isinstance(field, PIDRelation):
+                    continue
+                fields[name] = field
+                pending[name].update(_relation_ids(getattr(relations, name)))
+
+        for name, ids in pending.items():
+            field = fields[name]
+            cache = self._cache.setdefault(_cache_key(field), {})
+            missing = ids - cache.keys()
+            if missing:
+                for id_, obj in resolve_pids(field.pid_field, missing).items():
+                    cache.setdefault(id_, obj)
+
+    def inject(self, record):
+        """Make the relation fields of the record use the shared cache."""
+        relations = getattr(record, self.key, None)
+        if relations is None:
+            return
+        for name, field in _relation_fields(relations).items():
+            self._previous.setdefault((field, name), _get_cache(field))
+            _set_cache(field, self._cache, name)
+
+    def restore(self):
+        """Make the relation fields use their previous cache again."""
+        for (field, name), cache in self._previous.items():
+            _set_cache(field, cache, name)
+        self._previous = {}
+
+
+class RDMRecordIndexer(RecordIndexer):
+    """Record indexer processing the bulk queue in chunks.
+
+    Records of a chunk are fetched in one query and their relations are
+    resolved once for the whole chunk, instead of once per record. A record
+    queued several times in a chunk is indexed once.
+    """
+
+    relations_key = "relations"
+
+    def index(self, record, arguments=None, **kwargs):
+        """Index a record, making the cached searches stale if published."""
+        result = super().index(record, arguments=arguments, **kwargs)
+        if not getattr(record, "is_draft", False):
+            bump_search_generation()
+        return result
+
+    def delete(self, record, **kwargs):
+        """Delete a record from the index."""
+        result = super().delete(record, **kwargs)
+        if not getattr(record, "is_draft", False):
+            bump_search_generation()
+        return result
+
+    def process_bulk_queue(self, search_bulk_kwargs=None):
+        """Process the bulk queue, making the cached searches stale."""
+        result = super().process_bulk_queue(search_bulk_kwargs=search_bulk_kwargs)
+        if not getattr(self.record_cls, "is_draft", False):
+            bump_search_generation()
+        return result
+
+    def _actionsiter(self, message_iterator):
+        """Iterate bulk actions, one chunk of messages at a time."""
+        chunk_size = current_app.config["RDM_INDEXER_BULK_CHUNK_SIZE"]
+        iterator = iter(message_iterator)
+        while True:
+            messages = list(islice(iterator, chunk_size))
+            if not messages:
+                break
+            yield from self._chunk_actionsiter(messages)
+
+    def _chunk_actionsiter(self, messages):
+        """Iterate the bulk actions of a chunk of messages."""
+        payloads = [message.decode() for message in messages]
+        records = {}
+        cache = RelationsCache(self.relations_key)
+        try:
+            ids = list({p["id"] for p in payloads if p["op"] != "delete"})
+            if ids:
+                records = {str(r.id): r for r in self.record_cls.get_records(ids)}
+                cache.prefetch(records.values())
+        except Exception:
+            # Records are resolved one by one when the chunk can't be prefetched
+            current_app.logger.warning(
+                "Failed to prefetch relations for a chunk of records", exc_info=True
+            )
+
+        # The documents of the chunk are matched with the OAI sets at once
+        actions = []
+        try:
+            with deferred_oai_sets():
+                # Only the last message of a document in the chunk is processed.
+                last = {payload["id"]: i for i, payload in enumerate(payloads)}
+                for i, (message, payload) in enumerate(zip(messages, payloads)):
+                    if last[payload["id"]] != i:
+                        actions.append((message, None))
+                        continue
+                    try:
+                        if payload["op"] == "delete":
+                            action = self._delete_action(payload)
+                        else:
+                            action = self._index_action(
+                                payload, record=records.get(payload["id"]), cache=cache
+                            )
+                        actions.append((message, action))
+                    except NoResultFound:
+                        message.reject()
+                    except Exception:
+                        message.reject()
+                        current_app.logger.error(
+                            "Failed to index record {0}".format(payload.get("id")),
+                            exc_info=True,
+                        )
+        finally:
+            cache.restore()
+
+        # As for any message, it is acknowledged when its action is yielded, not
+        # when it's indexed: if the bulk request fails, the document is not
+        # indexed until it's queued again.
+        for message, action in actions:
+            if action is not None:
+                yield action
+            message.ack()
+
+    def _index_action(self, payload, record=None, cache=None):
+        """Bulk index action.
+
+        :param payload: Decoded message body.
+        :param record: The record if already fetched.
+        :param cache: A relations cache shared between records.
+        :returns: Dictionary defining the search engine bulk 'index' action.
+        """
+        if record is None:
+            record = self.record_cls.get_record(payload["id"])
+        if cache is not None:
+            cache.inject(record)
+        return index_action(self, record)
@@ -8,6 +8,8 @@
 
 """Permissions for Invenio RDM Records."""
 
+from copy import deepcopy
+
 from invenio_records_permissions.generators import (
     AnyUser,
     AuthenticatedUser,
@@ -16,6 +18,7 @@ from invenio_records_permissions.generators import (
 )
 from invenio_records_permissions.policies.records import RecordPermissionPolicy
 
+from ..cache import TTLCache
 from .generators import (
     CommunityAction,
     IfFileIsLocal,
@@ -25,6 +28,9 @@ from .generators import (
     SubmissionReviewer,
 )
 
+query_filters_cache = TTLCache()
+"""Query filters of the policies per action and needs of the identity."""
+
 
 class RDMRecordPermissionPolicy(RecordPermissionPolicy):
     """Access control configuration for records.
@@ -143,3 +149,23 @@ class RDMRecordPermissionPolicy(RecordPermissionPolicy):
     can_commit_files = [Disable()]
     can_update_files = [Disable()]
     can_delete_files = [Disable()]
+
+    @property
+    def query_filters(self):
+        """List of search engine query filters.
+
+        The filters only depend on the needs provided by the identity, so
+        they are built once per action and set of needs (e.g. for a curator
+        of many communities) and reused until they expire. Copies of the
+        cached queries are returned, so that callers can modify them.
+        """
+        identity = self.over.get("identity")
+        if identity is None or self.over.keys() != {"identity"}:
+            return super().query_filters
+
+        key = (type(self), self.action, frozenset(identity.provides))
+        filters = query_filters_cache.get(key)
+        if filters is None:
+            filters = super().query_filters
+            query_filters_cache.set(key, filters)
+        return deepcopy(filters)
@@ -10,8 +10,9 @@
 from flask.globals import current_app
 from flask_babelex import lazy_gettext as _
 from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_pidstore.models import PIDStatus
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from marshmallow import ValidationError
+from sqlalchemy import and_, or_
 
 from ..errors import ValidationErrorWithMessageAsList
 from .errors import PIDSchemeNotSupportedError, ProviderNotSupportedError
@@ -129,6 +130,36 @@ class PIDManager:
 
         return provider.get(identifier)
 
+    def read_all(self, pids):
+        """Read the existing PIDs of a pids dict with a single query.
+
+        :returns: a dictionary of the found PIDs by scheme.
+        """
+        values = {}
+        for scheme, pid_attrs in pids.items():
+            identifier = pid_attrs.get("identifier")
+            if identifier and scheme in self._providers:
+                provider = self._get_provider(scheme, pid_attrs.get("provider"))
+                values[(provider.pid_type, identifier)] = scheme
+        if not values:
+            return {}
+
+        pid_types = {}
+        for pid_type, identifier in values:
+            pid_types.setdefault(pid_type, []).append(identifier)
+        query = PersistentIdentifier.query.filter(
+            or_(
+                *[
+                    and_(
+                        PersistentIdentifier.pid_type == pid_type,
+                        PersistentIdentifier.pid_value.in_(identifiers),
+                    )
+                    for pid_type, identifiers in pid_types.items()
+                ]
+            )
+        )
+        return {values[(pid.pid_type, pid.pid_value)]: pid for pid in query}
+
     def create(self, draft, scheme, identifier=None, provider_name=None):
         """Create a pid for a draft.
 
@@ -202,19 +233,26 @@ class PIDManager:
         provider = self._get_provider(scheme, pid_attrs["provider"])
         pid = provider.get(pid_attrs["identifier"])
 
-        provider.update(pid, record=record)
+        return provider.update(pid, record=record)
 
-    def reserve(self, draft, scheme, identifier, provider_name):
+    def reserve(self, draft, scheme, identifier, provider_name, pid=None):
         """Reserve a PID."""
         provider = self._get_provider(scheme, provider_name)
-        pid = provider.get(identifier)
+        pid = pid or provider.get(identifier)
         if pid.is_new():  # not reserved and not registered
             provider.reserve(pid, record=draft)
 
     def reserve_all(self, draft, pids):
         """Reserve PIDs from a list."""
+        existing = self.read_all(pids)
         for scheme, pid_attrs in pids.items():
-            self.reserve(draft, scheme, pid_attrs["identifier"], pid_attrs["provider"])
+            self.reserve(
+                draft,
+                scheme,
+                pid_attrs["identifier"],
+                pid_attrs["provider"],
+                pid=existing.get(scheme),
+            )
 
     def register(self, record, scheme, url):
         """Register a PID of a record."""
@@ -228,7 +266,7 @@ class PIDManager:
         provider = self._get_provider(scheme, pid_attrs["provider"])
         pid = provider.get(pid_attrs["identifier"])
 
-        provider.register(pid, record=record, url=url)
+        return provider.register(pid, record=record, url=url)
 
     def discard(self, scheme, identifier, provider_name=None):
         """Discard a PID."""
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Outbox of the PID registrations and updates on remote providers.
+
+Instead of contacting the remote provider (e.g. DataCite) right after each
+publish, the operations are stored in the database and drained periodically
+by the ``process_pids_outbox`` task at a configured rate. Failed operations
+are retried with an exponential backoff, and draining stops for a while when
+the provider keeps failing (circuit breaker).
+"""
+
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+from invenio_access.permissions import system_identity
+from invenio_db import db
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+from ...proxies import current_rdm_records
+from ...records.models import RDMPIDOperation
+
+
+class CircuitBreaker:
+    """Stop calling a failing remote provider for a cooldown period.
+
+    The state is kept per process, i.e. per worker.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.failures = 0
+        self.opened_at = None
+
+    def is_open(self, cooldown):
+        """Whether calls must not be attempted."""
+        if self.opened_at is None:
+            return False
+        if time.monotonic() - self.opened_at >= cooldown:
+            # Half-open: let the next call through
+            self.opened_at = None
+            return False
+        return True
+
+    def success(self):
+        """Record a successful call."""
+        self.failures = 0
+        self.opened_at = None
+
+    def failure(self, threshold):
+        """Record a failed call."""
+        self.failures += 1
+        if self.failures >= threshold:
+            self.opened_at = time.monotonic()
+
+
+circuit_breaker = CircuitBreaker()
+
+
+def enqueue(recid, scheme):
+    """Add the registration or update of a PID to the outbox.
+
+    An operation already pending for the same record and scheme is
+    rescheduled instead of being duplicated.
+    """
+    now = datetime.utcnow()
+    values = {"attempts": 0, "next_attempt": now, "last_error": None}
+    query = RDMPIDOperation.query.filter_by(recid=recid, scheme=scheme)
+    if query.update(values):
+        return
+    try:
+        with db.session.begin_nested():
+            db.session.add(RDMPIDOperation(recid=recid, scheme=scheme, **values))
+    except IntegrityError:
+        # Added concurrently
+        query.update(values)
+
+
+def _backoff(attempts):
+    """Delay before the next attempt of an operation."""
+    base = current_app.config["RDM_PIDS_OUTBOX_BACKOFF"]
+    maximum = current_app.config["RDM_PIDS_OUTBOX_MAX_BACKOFF"]
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), maximum))
+
+
+def process(limit=None):
+    """Attempt the due operations of the outbox.
+
+    :param limit: maximum number of operations to attempt.
+    :returns: a dictionary with the number of succeeded and failed operations.
+    """
+    config = current_app.config
+    limit = limit or config["RDM_PIDS_OUTBOX_BATCH_SIZE"]
+    max_attempts = config["RDM_PIDS_OUTBOX_MAX_ATTEMPTS"]
+    rate = config["RDM_PIDS_OUTBOX_RATE"]
+    threshold = config["RDM_PIDS_OUTBOX_CIRCUIT_THRESHOLD"]
+    cooldown = config["RDM_PIDS_OUTBOX_CIRCUIT_COOLDOWN"]
+    service = current_rdm_records.records_service.pids
+
+    stats = {"succeeded": 0, "failed": 0}
+    if circuit_breaker.is_open(cooldown):
+        return stats
+
+    operations = (
+        RDMPIDOperation.query.filter(
+            RDMPIDOperation.next_attempt <= datetime.utcnow(),
+            RDMPIDOperation.attempts < max_attempts,
+        )
+        .order_by(RDMPIDOperation.next_attempt)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    last_call = None
+    for operation in operations:
+        if circuit_breaker.is_open(cooldown):
+            break
+        # Rate limiting
+        if rate and last_call is not None:
+            delay = 1 / rate - (time.monotonic() - last_call)
+            if delay > 0:
+                time.sleep(delay)
+        last_call = time.monotonic()
+
+        error = None
+        try:
+            with db.session.begin_nested():
+                record = service.record_cls.pid.resolve(
+                    operation.recid, registered_only=False
+                )
+                if not service._register_or_update(
+                    system_identity, record, operation.scheme
+                ):
+                    # Roll back the local changes of the PID
+                    raise RuntimeError("The remote provider rejected the operation.")
+        except Exception as e:
+            current_app.logger.warning(
+                f"Failed to register or update {operation.scheme} PID of "
+                f"record {operation.recid}",
+                exc_info=True,
+            )
+            error = str(e) or type(e).__name__
+
+        if error is None:
+            circuit_breaker.success()
+            db.session.delete(operation)
+            stats["succeeded"] += 1
+        else:
+            circuit_breaker.failure(threshold)
+            operation.attempts += 1
+            operation.next_attempt = datetime.utcnow() + _backoff(operation.attempts)
+            operation.last_error = error
+            stats["failed"] += 1
+
+    db.session.commit()
+    return stats
+
+
+def metrics():
+    """Depth of the outbox.
+
+    :returns: a dictionary with the number of ``pending`` operations (never
+        attempted), ``retrying`` operations (failed, to be attempted again),
+        ``failed`` operations (no more attempts), the ``due`` ones among the
+        first two, the creation time of the ``oldest`` operation and whether
+        the circuit breaker of this process is ``open``.
+    """
+    max_attempts = current_app.config["RDM_PIDS_OUTBOX_MAX_ATTEMPTS"]
+    cooldown = current_app.config["RDM_PIDS_OUTBOX_CIRCUIT_COOLDOWN"]
+    model = RDMPIDOperation
+
+    def count(*filters):
+        return db.session.query(func.count(model.id)).filter(*filters).scalar()
+
+    return {
+        "pending": count(model.attempts == 0),
+        "retrying": count(model.attempts > 0, model.attempts < max_attempts),
+        "failed": count(model.attempts >= max_attempts),
+        "due": count(
+            model.attempts < max_attempts, model.next_attempt <= datetime.utcnow()
+        ),
+        "oldest": db.session.query(func.min(model.created)).scalar(),
+        "open": circuit_breaker.is_open(cooldown),
+    }
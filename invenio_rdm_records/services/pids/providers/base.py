@@ -122,8 +122,11 @@ class PIDProvider:
         return True
 
     def update(self, pid, **kwargs):
-        """Update information about the persistent identifier."""
-        pass
+        """Update information about the persistent identifier.
+
+        There is no remote information to update for local PIDs.
+        """
+        return True
 
     def delete(self, pid, **kwargs):
         """Delete a persistent identifier.
@@ -9,18 +9,102 @@
 """DataCite DOI Provider."""
 
 import json
+import os
+import ssl
 import warnings
 
-from datacite import DataCiteRESTClient
-from datacite.errors import DataCiteError
+import requests
+from datacite import DataCiteRESTClient as BaseDataCiteRESTClient
+from datacite.errors import DataCiteError, HttpError
+from datacite.request import DataCiteRequest
 from flask import current_app
 from flask_babelex import lazy_gettext as _
 from invenio_pidstore.models import PIDStatus
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 from invenio_rdm_records.resources.serializers import DataCite43JSONSerializer
 
 from .base import PIDProvider
 
+_sessions = {}
+"""HTTP sessions by process and configuration prefix."""
+
+
+class DataCiteSessionRequest(DataCiteRequest):
+    """DataCite request sent through a pooled HTTP session."""
+
+    def __init__(self, session, **kwargs):
+        """Constructor."""
+        super().__init__(**kwargs)
+        self.session = session
+
+    def request(self, url, method="GET", body=None, params=None, headers=None):
+        """Make a request."""
+        params = params or {}
+        headers = headers or {}
+
+        self.data = None
+        self.code = None
+
+        if self.default_params:
+            params.update(self.default_params)
+
+        if self.base_url:
+            url = self.base_url + url
+
+        if body and isinstance(body, str):
+            body = body.encode("utf-8")
+
+        kwargs = dict(
+            auth=HTTPBasicAuth(self.username, self.password),
+            params=params,
+            headers=headers,
+        )
+        if method in ("POST", "PUT"):
+            kwargs["data"] = body
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+
+        try:
+            return self.session.request(method, url, **kwargs)
+        except (RequestException, ssl.SSLError) as e:
+            raise HttpError(e)
+
+
+class DataCiteRESTClient(BaseDataCiteRESTClient):
+    """DataCite REST API client reusing the connections of an HTTP session."""
+
+    def __init__(self, *args, session=None, **kwargs):
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+        self.session = session or requests.Session()
+
+    def _create_request(self):
+        """Create a new request sent through the session."""
+        return DataCiteSessionRequest(
+            self.session,
+            base_url=self.api_url,
+            username=self.username,
+            password=self.password,
+            timeout=self.timeout,
+        )
+
+    def get_doi_state(self, doi):
+        """Get the state of a DOI.
+
+        :returns: "draft", "registered" or "findable", or ``None`` if the DOI
+            does not exist.
+        """
+        resp = self._create_request().get("dois/" + doi)
+        if resp.status_code == 200:
+            return resp.json()["data"]["attributes"]["state"]
+        if resp.status_code == 404:
+            return None
+        raise DataCiteError.factory(resp.status_code, resp.text)
+
 
 class DataCiteClient:
     """DataCite Client."""
@@ -30,6 +114,7 @@ class DataCiteClient:
         self.name = name
         self._config_prefix = config_prefix or "DATACITE"
         self._api = None
+        self._credentials_checked = False
 
     def cfgkey(self, key):
         """Generate a configuration key."""
@@ -55,7 +140,11 @@ class DataCiteClient:
         """Returns if the client has the credentials properly set up.
 
         If the client is running on test mode the credentials are not required.
+        The check is only done once per client.
         """
+        if self._credentials_checked:
+            return
+        self._credentials_checked = True
         if not (self.cfg("username") and self.cfg("password") and self.cfg("prefix")):
             warnings.warn(
                 f"The {self.__class__.__name__} is misconfigured. Please "
@@ -64,6 +153,29 @@ class DataCiteClient:
                 UserWarning,
             )
 
+    @property
+    def session(self):
+        """HTTP session shared by the clients of the current process."""
+        key = (os.getpid(), self._config_prefix)
+        session = _sessions.get(key)
+        if session is None:
+            retry = Retry(
+                total=self.cfg("retries", 3),
+                backoff_factor=self.cfg("retry_backoff", 0.5),
+                status_forcelist=(429, 500, 502, 503, 504),
+                # Return the last response, so that it raises a DataCiteError
+                raise_on_status=False,
+            )
+            pool_size = self.cfg("pool_size", 10)
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+        return session
+
     @property
     def api(self):
         """DataCite REST API client instance."""
@@ -74,6 +186,8 @@ class DataCiteClient:
                 self.cfg("password"),
                 self.cfg("prefix"),
                 self.cfg("test_mode", True),
+                timeout=self.cfg("timeout"),
+                session=self.session,
             )
         return self._api
 
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Reconciliation of the local DOIs with the registration agency."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from sqlalchemy.orm.exc import NoResultFound
+
+from ...proxies import current_rdm_records
+from . import outbox, tasks
+
+EXPECTED_STATES = {
+    PIDStatus.NEW: {None},
+    PIDStatus.RESERVED: {"draft"},
+    PIDStatus.REGISTERED: {"findable"},
+    # hidden when registered, removed when reserved
+    PIDStatus.DELETED: {"registered", None},
+}
+"""Remote states of a DOI matching each local status."""
+
+
+class RateLimiter:
+    """Limit the calls per second shared by several threads."""
+
+    def __init__(self, rate):
+        """Constructor."""
+        self.interval = 1 / rate if rate else 0
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def wait(self):
+        """Wait until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _iter_pids(provider, chunk_size):
+    """Yield chunks of the local PIDs of a provider, in keyset order."""
+    last_id = 0
+    while True:
+        pids = (
+            PersistentIdentifier.query.filter(
+                PersistentIdentifier.pid_type == provider.pid_type,
+                PersistentIdentifier.pid_provider == provider.name,
+                PersistentIdentifier.id > last_id,
+            )
+            .order_by(PersistentIdentifier.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not pids:
+            return
+        yield pids
+        last_id = pids[-1].id
+
+
+def _fix(pid):
+    """Reset a DOI registered only locally, so that it is registered again.
+
+    Registering (rather than updating) a DOI makes it findable remotely.
+
+    :returns: the id of the published record of the DOI, if any.
+    """
+    record_cls = current_rdm_records.records_service.record_cls
+    try:
+        record = record_cls.get_record(pid.object_uuid)
+    except NoResultFound:
+        return None
+    pid.sync_status(PIDStatus.RESERVED)
+    return record["id"]
+
+
+def reconcile(scheme="doi", fix=False, concurrency=None, rate=None, chunk_size=None):
+    """Compare the status of the local PIDs with their remote state.
+
+    :param scheme: the scheme of the PIDs. Its default provider's client must
+        support getting the remote state of a PID (e.g. ``DataCiteClient``).
+    :param fix: send again the registration of PIDs registered only locally.
+    :param concurrency: number of concurrent requests to the remote provider.
+    :param rate: maximum number of requests per second (``0`` for no limit).
+    :param chunk_size: number of local PIDs loaded at once.
+    :returns: a dictionary with the number of ``checked`` and ``fixed`` PIDs
+        and the ``differences``, as dictionaries of the PID value, its local
+        status and its remote state.
+    """
+    config = current_app.config
+    concurrency = concurrency or config["RDM_PIDS_RECONCILE_CONCURRENCY"]
+    limiter = RateLimiter(
+        rate if rate is not None else config["RDM_PIDS_RECONCILE_RATE"]
+    )
+    chunk_size = chunk_size or config["RDM_PIDS_RECONCILE_CHUNK_SIZE"]
+
+    provider = current_rdm_records.records_service.pids.pid_manager._get_provider(
+        scheme
+    )
+    api = provider.client.api
+    app = current_app._get_current_object()
+
+    def remote_state(pid_value):
+        # Runs in the threads of the executor, which have no app context
+        limiter.wait()
+        try:
+            return api.get_doi_state(pid_value)
+        except Exception:
+            app.logger.warning(
+                f"Failed to get the remote state of {pid_value}", exc_info=True
+            )
+            return "unknown"
+
+    stats = {"checked": 0, "fixed": 0, "differences": []}
+    recids = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for pids in _iter_pids(provider, chunk_size):
+            states = executor.map(remote_state, [pid.pid_value for pid in pids])
+            for pid, state in zip(pids, states):
+                stats["checked"] += 1
+                if state in EXPECTED_STATES.get(pid.status, {state}):
+                    continue
+                stats["differences"].append(
+                    {"pid": pid.pid_value, "local": pid.status.name, "remote": state}
+                )
+                if (
+                    fix
+                    and pid.status == PIDStatus.REGISTERED
+                    and state in (None, "draft")
+                ):
+                    recid = _fix(pid)
+                    if recid is None:
+                        continue
+                    stats["fixed"] += 1
+                    if config["RDM_PIDS_OUTBOX_ENABLED"]:
+                        outbox.enqueue(recid, scheme)
+                    else:
+                        recids.append(recid)
+
+    db.session.commit()
+    for recid in recids:
+        tasks.register_or_update_pid.delay(recid, scheme)
+    return stats
@@ -10,9 +10,11 @@
 from invenio_drafts_resources.services.records import RecordService
 from invenio_pidstore.models import PersistentIdentifier
 from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
-from invenio_requests.services.results import EntityResolverExpandableField
 
-from invenio_rdm_records.services.results import ParentCommunitiesExpandableField
+from invenio_rdm_records.services.results import (
+    ParentCommunitiesExpandableField,
+    ReviewReceiverExpandableField,
+)
 
 
 class PIDsService(RecordService):
@@ -30,7 +32,7 @@ class PIDsService(RecordService):
         Expand community field to return community details.
         """
         return [
-            EntityResolverExpandableField("parent.review.receiver"),
+            ReviewReceiverExpandableField("parent.review.receiver"),
             ParentCommunitiesExpandableField("parent.communities.default"),
         ]
 
@@ -122,19 +124,17 @@ class PIDsService(RecordService):
             expand=expand,
         )
 
-    @unit_of_work()
-    def register_or_update(self, identity, id_, scheme, uow=None, expand=False):
-        """Register or update a PID of a record.
+    def _register_or_update(self, identity, record, scheme):
+        """Register or update a PID of a record on the remote provider.
 
-        If the PID has already been register it updates the remote.
+        :returns: `True` if the remote provider accepted the operation.
         """
-        record = self.record_cls.pid.resolve(id_, registered_only=False)
         # no need to validate since the record class was already published
         pid_attrs = record.pids.get(scheme)
         pid = self._manager.read(scheme, pid_attrs["identifier"], pid_attrs["provider"])
         if pid.is_registered():
             self.require_permission(identity, "pid_update", record=record)
-            self._manager.update(record, scheme)
+            return self._manager.update(record, scheme)
         else:
             self.require_permission(identity, "pid_register", record=record)
             # Determine landing page (use scheme specific if available)
@@ -142,7 +142,16 @@ class PIDsService(RecordService):
             url = links["self_html"]
             if f"self_{scheme}" in links:
                 url = links[f"self_{scheme}"]
-            self._manager.register(record, scheme, url)
+            return self._manager.register(record, scheme, url)
+
+    @unit_of_work()
+    def register_or_update(self, identity, id_, scheme, uow=None, expand=False):
+        """Register or update a PID of a record.
+
+        If the PID has already been register it updates the remote.
+        """
+        record = self.record_cls.pid.resolve(id_, registered_only=False)
+        self._register_or_update(identity, record, scheme)
 
         # draft and index do not need commit/refresh
 
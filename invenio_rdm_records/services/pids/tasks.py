@@ -8,10 +8,13 @@
 """RDM PIDs Service tasks."""
 
 from celery import shared_task
+from flask import current_app
 from invenio_access.permissions import system_identity
 
 from invenio_rdm_records.proxies import current_rdm_records
 
+from . import outbox, reconcile
+
 
 @shared_task(ignore_result=True)
 def register_or_update_pid(recid, scheme):
@@ -21,3 +24,24 @@ def register_or_update_pid(recid, scheme):
         identity=system_identity,
         scheme=scheme,
     )
+
+
+@shared_task(ignore_result=True)
+def process_pids_outbox():
+    """Register or update the PIDs waiting in the outbox."""
+    outbox.process()
+
+
+@shared_task(ignore_result=True)
+def reconcile_pids(scheme="doi", fix=False):
+    """Compare the local PIDs with the registration agency and report drift."""
+    stats = reconcile.reconcile(scheme=scheme, fix=fix)
+    for diff in stats["differences"]:
+        current_app.logger.warning(
+            f"PID {diff['pid']} is {diff['local']} locally but {diff['remote']} "
+            "remotely."
+        )
+    current_app.logger.info(
+        f"Reconciled {stats['checked']} {scheme} PIDs: "
+        f"{len(stats['differences'])} differences, {stats['fixed']} fixed."
+    )
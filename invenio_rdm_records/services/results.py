@@ -7,18 +7,83 @@
 
 """Service results."""
 
+from types import SimpleNamespace
+
 from invenio_communities.communities.resolver import pick_fields
 from invenio_communities.proxies import current_communities
 from invenio_records_resources.services.records.results import ExpandableField
+from invenio_requests.services.results import EntityResolverExpandableField
+
+from ..cache import TTLCache
+
+
+class CachedCommunitiesReader:
+    """Read many communities, keeping the public ones in a short-lived cache.
+
+    The expandable fields resolve the communities of a whole page of results
+    with one ``read_many`` per service. Returning this reader as the service
+    of the community fields groups them together (e.g. the default community
+    and the review receiver) and lets the public communities be reused
+    across requests. Restricted communities are always read, since whether
+    they can be read depends on the identity.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.cache = TTLCache()
+
+    def read_many(self, identity, ids):
+        """Read the communities of the given ids."""
+        hits = []
+        missing = []
+        for id_ in ids:
+            hit = self.cache.get(id_)
+            if hit is None:
+                missing.append(id_)
+            else:
+                hits.append(hit)
+
+        if missing:
+            results = current_communities.service.read_many(identity, missing)
+            for hit in results.hits:
+                if hit["access"]["visibility"] == "public":
+                    self.cache.set(hit["id"], hit)
+                hits.append(hit)
+
+        return SimpleNamespace(hits=hits)
+
+
+communities_reader = CachedCommunitiesReader()
+"""Communities reader of the expandable fields."""
 
 
 class ParentCommunitiesExpandableField(ExpandableField):
     """Parent communities field."""
 
+    def __init__(self, field_name):
+        """Constructor."""
+        super().__init__(field_name)
+        self._picked = {}
+
     def get_value_service(self, value):
         """Return the value and the service via entity resolvers."""
-        return value, current_communities.service
+        return value, communities_reader
 
     def pick(self, identity, resolved_rec):
         """Pick fields defined in the entity resolver."""
-        return pick_fields(identity, resolved_rec)
+        # Many hits of a page usually share the same community
+        id_ = resolved_rec["id"]
+        if id_ not in self._picked:
+            self._picked[id_] = pick_fields(identity, resolved_rec)
+        return self._picked[id_]
+
+
+class ReviewReceiverExpandableField(EntityResolverExpandableField):
+    """Review receiver field, reading communities with the cached reader."""
+
+    def get_value_service(self, value):
+        """Return the value and the service via entity resolvers."""
+        value, service = super().get_value_service(value)
+        if service is current_communities.service:
+            service = communities_reader
+        return value, service
@@ -7,16 +7,23 @@
 
 """RDM Review Service."""
 
+from uuid import UUID
+
 from flask import current_app
 from flask_babelex import lazy_gettext as _
 from invenio_communities.communities.records.systemfields.access import CommunityAccess
 from invenio_drafts_resources.services.records import RecordService
+from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_records_resources.services.uow import (
     RecordCommitOp,
     RecordIndexOp,
     unit_of_work,
 )
-from invenio_requests import current_request_type_registry, current_requests_service
+from invenio_requests import (
+    current_request_type_registry,
+    current_requests_service,
+)
+from invenio_requests.errors import ActionError
 from invenio_requests.resolvers.registry import ResolverRegistry
 from marshmallow import ValidationError
 
@@ -27,6 +34,7 @@ from ..errors import (
     ReviewNotFoundError,
     ReviewStateError,
 )
+from ..uow import BulkUnitOfWork, uow_cache
 
 
 class ReviewService(RecordService):
@@ -166,6 +174,12 @@ class ReviewService(RecordService):
         if community_is_restricted and not record_is_restricted:
             raise ReviewInconsistentAccessRestrictions()
 
+        # Hand the resolved draft and community to the submit action
+        uow_cache(uow, "review_topics")[str(draft.parent.review.id)] = draft
+        uow_cache(uow, "review_receivers")[
+            str(draft.parent.review.id)
+        ] = resolved_community
+
         # All other preconditions can be checked by the action itself which can
         # raise appropriate exceptions.
         request_item = current_requests_service.execute_action(
@@ -180,3 +194,81 @@ class ReviewService(RecordService):
         uow.register(RecordIndexOp(draft, indexer=self.indexer))
 
         return request_item
+
+    #
+    # Bulk curation
+    #
+    bulk_actions = ("accept", "decline")
+    """Actions that can be executed on many review requests at once."""
+
+    def bulk_execute_action(self, identity, action, request_ids, data=None):
+        """Accept or decline many review requests.
+
+        The requests are processed in chunks, each one in a single database
+        transaction and each request in its own savepoint. A request that
+        can't be processed (e.g. the identity is not a curator of the community, or the record
+        is invalid) does not stop the other ones.
+
+        :param action: the action to execute, ``accept`` or ``decline``.
+        :param request_ids: the ids of the review requests.
+        :param data: an optional comment added to all the requests.
+        :returns: the result of each request in the given order, as a
+            dictionary with the request ``id`` and either its new ``status``
+            or the ``error`` that prevented the action.
+        """
+        if action not in self.bulk_actions:
+            raise ValidationError(_("Invalid action."), field_name="action")
+
+        chunk_size = current_app.config["RDM_REVIEW_BULK_CHUNK_SIZE"]
+        request_ids = list(dict.fromkeys(str(id_) for id_ in request_ids))
+        results = []
+        for i in range(0, len(request_ids), chunk_size):
+            results.extend(
+                self._bulk_execute_chunk(
+                    identity, action, request_ids[i : i + chunk_size], data
+                )
+            )
+        return results
+
+    def _bulk_execute_chunk(self, identity, action, request_ids, data):
+        """Execute an action on a chunk of review requests."""
+        request_cls = current_requests_service.record_cls
+        valid_ids = []
+        for id_ in request_ids:
+            try:
+                valid_ids.append(UUID(id_))
+            except ValueError:
+                pass
+        requests = {str(r.id): r for r in request_cls.get_records(valid_ids)}
+
+        results = []
+        with BulkUnitOfWork() as uow:
+            for id_ in request_ids:
+                request = requests.get(id_)
+                if request is None or request.type.type_id not in self.supported_types:
+                    results.append({"id": id_, "error": str(ReviewNotFoundError())})
+                    continue
+
+                try:
+                    with uow.savepoint():
+                        item = current_requests_service.execute_action(
+                            identity, id_, action, data=data, uow=uow
+                        )
+                except (
+                    ActionError,
+                    PermissionDeniedError,
+                    ReviewStateError,
+                    ValidationError,
+                ) as e:
+                    results.append({"id": id_, "error": str(e)})
+                    continue
+                except Exception as e:
+                    # e.g. the draft was deleted, or its PIDs can't be registered
+                    current_app.logger.error(
+                        f"Failed to {action} review request {id_}", exc_info=True
+                    )
+                    results.append({"id": id_, "error": str(e) or type(e).__name__})
+                    continue
+                results.append({"id": id_, "status": item.to_dict()["status"]})
+            uow.commit()
+        return results
@@ -12,6 +12,7 @@
 from datetime import datetime
 
 import arrow
+from flask import current_app
 from flask_babelex import lazy_gettext as _
 from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
@@ -21,6 +22,7 @@ from marshmallow.exceptions import ValidationError
 from sqlalchemy.orm.exc import NoResultFound
 
 from ...secret_links.errors import InvalidPermissionLevelError
+from ..uow import ParentRecordsIndexOp
 
 
 class SecretLinkService(RecordService):
@@ -42,6 +44,13 @@ class SecretLinkService(RecordService):
             record, parent = self._get_draft_and_parent_by_id(_id)
         return record, parent
 
+    @unit_of_work()
+    def _index_related_records(self, record, parent, uow=None):
+        """Index the record, and the other records of the parent in bulk."""
+        if not current_app.config["RDM_INDEX_RELATED_RECORDS_IN_BULK"]:
+            return super()._index_related_records(record, parent, uow=uow)
+        uow.register(ParentRecordsIndexOp(self, record, parent))
+
     @property
     def schema_secret_link(self):
         """Schema for secret links."""
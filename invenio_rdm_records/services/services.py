@@ -12,20 +12,33 @@
 """RDM Record Service."""
 
 
+import random
 import tempfile
+import time
+from datetime import datetime
 
 import arrow
 import importlib_metadata as metadata
+from flask import current_app
 from flask_iiif.api import IIIFImageAPIWrapper
-from invenio_communities import current_communities
+from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
 from invenio_records_resources.services import LinksTemplate, Service
 from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
-from invenio_requests.services.results import EntityResolverExpandableField
+from invenio_search import current_search_client
 from invenio_search.engine import dsl
+from invenio_search.utils import build_alias_name
+from sqlalchemy import and_, or_
 
+from invenio_rdm_records.profiling import Timings, count_queries, query_count
+from invenio_rdm_records.records.models import RDMReindexCheckpoint
+from invenio_rdm_records.services.communities import resolve_community_id
 from invenio_rdm_records.services.errors import EmbargoNotLiftedError
-from invenio_rdm_records.services.results import ParentCommunitiesExpandableField
+from invenio_rdm_records.services.results import (
+    ParentCommunitiesExpandableField,
+    ReviewReceiverExpandableField,
+)
+from invenio_rdm_records.services.uow import uow_cache
 
 try:
     metadata.distribution("wand")
@@ -54,6 +67,7 @@ class RDMRecordService(RecordService):
         self._secret_links = secret_links_service
         self._pids = pids_service
         self._review = review_service
+        self.component_timings = Timings()
 
     #
     # Subservices
@@ -83,10 +97,72 @@ class RDMRecordService(RecordService):
         Expand community field to return community details.
         """
         return [
-            EntityResolverExpandableField("parent.review.receiver"),
+            ReviewReceiverExpandableField("parent.review.receiver"),
             ParentCommunitiesExpandableField("parent.communities.default"),
         ]
 
+    #
+    # Components
+    #
+    def run_components(self, action, *args, **kwargs):
+        """Run components for a given action.
+
+        A share of the runs, set by ``RDM_SERVICE_TRACING_SAMPLE_RATE``, is
+        traced: the time and queries of each component are logged and
+        aggregated in ``component_timings``.
+        """
+        rate = current_app.config.get("RDM_SERVICE_TRACING_SAMPLE_RATE")
+        if not rate or random.random() >= rate:
+            return super().run_components(action, *args, **kwargs)
+
+        count_queries()
+        uow = kwargs.pop("uow", None)
+        for component in self.components:
+            if hasattr(component, action):
+                if uow is not None:
+                    component.uow = uow
+                name = type(component).__name__
+                queries = query_count()
+                start = time.perf_counter()
+                getattr(component, action)(*args, **kwargs)
+                elapsed = time.perf_counter() - start
+                queries = query_count() - queries
+                component.uow = None
+
+                self.component_timings.add(f"{action}.{name}", elapsed, queries)
+                current_app.logger.info(
+                    f"Component {name} ran {action} in {elapsed * 1000:.2f} ms "
+                    f"with {queries} queries",
+                    extra={
+                        "service": self.id,
+                        "action": action,
+                        "component": name,
+                        "duration_ms": elapsed * 1000,
+                        "queries": queries,
+                    },
+                )
+
+    #
+    # Validation
+    #
+    def _validate_draft(
+        self, identity, draft, ignore_field_permissions=False, uow=None
+    ):
+        """Validate a draft once per unit of work.
+
+        The validations are remembered per draft revision in the given unit
+        of work, so that e.g. a submission is not validated again by the
+        request action.
+        """
+        validated = uow_cache(uow, "validated_drafts") if uow else {}
+        key = (draft.id, draft.revision_id)
+        if key in validated:
+            return
+        super()._validate_draft(
+            identity, draft, ignore_field_permissions=ignore_field_permissions
+        )
+        validated[key] = True
+
     #
     # Service methods
     #
@@ -127,14 +203,240 @@ class RDMRecordService(RecordService):
 
         return self.scan(identity=identity, q=embargoed_q)
 
+    #
+    # Incremental indexing
+    #
+    def _iter_changed(self, model_cls, since=None, chunk_size=None):
+        """Iterate over chunks of ``(id, version_id, is_deleted)`` rows.
+
+        Rows are read in ``(updated, id)`` keyset order, so that every chunk
+        is a range scan on ``updated`` no matter how deep we are in the table.
+        If ``since`` is given, only rows updated at or after it are returned.
+        """
+        chunk_size = chunk_size or current_app.config["RDM_REINDEX_CHUNK_SIZE"]
+        columns = (
+            model_cls.id,
+            model_cls.version_id,
+            model_cls.updated,
+            model_cls.json.is_(None),
+        )
+        last = None
+        while True:
+            query = db.session.query(*columns)
+            if since is not None:
+                query = query.filter(model_cls.updated >= since)
+            if last is not None:
+                last_updated, last_id = last
+                query = query.filter(
+                    or_(
+                        model_cls.updated > last_updated,
+                        and_(model_cls.updated == last_updated, model_cls.id > last_id),
+                    )
+                )
+            rows = (
+                query.order_by(model_cls.updated, model_cls.id).limit(chunk_size).all()
+            )
+            if not rows:
+                return
+            yield [
+                (id_, version_id, is_deleted) for id_, version_id, _, is_deleted in rows
+            ]
+            last = (rows[-1][2], rows[-1][0])
+
+    reindex_checkpoint = "reindex-changed"
+    """Name of the checkpoint of :meth:`reindex_changed`."""
+
+    def reindex_changed_since(self):
+        """Return the start time of the last successful reindexing of changes.
+
+        Returns ``None`` if the changes were never reindexed.
+        """
+        checkpoint = db.session.query(RDMReindexCheckpoint).get(self.reindex_checkpoint)
+        return checkpoint.since if checkpoint else None
+
+    def reindex_changed(self, identity, since=None, chunk_size=None):
+        """Reindex records, drafts and parents updated since ``since``.
+
+        If ``since`` is not given, the changes since the last successful run
+        are reindexed (see :meth:`reindex_changed_since`), and the checkpoint
+        is moved to the start of this run once all the changes were sent for
+        reindexing. Changed parents cause all of their records and drafts to
+        be reindexed. Deleted rows are removed from the index. Returns a
+        dictionary with the number of records and drafts sent for
+        (de-)indexing.
+        """
+        targets = [
+            (self.record_cls, self.indexer, "records"),
+            (self.draft_cls, self.draft_indexer, "drafts"),
+        ]
+        checkpoint = since is None
+        started = datetime.utcnow()
+        if checkpoint:
+            since = self.reindex_changed_since()
+
+        stats = {"records": 0, "drafts": 0}
+        for cls, indexer, key in targets:
+            for rows in self._iter_changed(cls.model_cls, since, chunk_size):
+                indexer.bulk_index([id_ for id_, _, deleted in rows if not deleted])
+                indexer.bulk_delete([id_ for id_, _, deleted in rows if deleted])
+                stats[key] += len(rows)
+
+        parent_model = self.record_cls.parent_record_cls.model_cls
+        for rows in self._iter_changed(parent_model, since, chunk_size):
+            parent_ids = [id_ for id_, _, _ in rows]
+            for cls, indexer, key in targets:
+                model_cls = cls.model_cls
+                query = db.session.query(model_cls.id).filter(
+                    model_cls.parent_id.in_(parent_ids),
+                    model_cls.json.isnot(None),
+                )
+                ids = [row.id for row in query]
+                indexer.bulk_index(ids)
+                stats[key] += len(ids)
+
+        if checkpoint:
+            # Rows updated during this run are reindexed again by the next one
+            db.session.merge(
+                RDMReindexCheckpoint(name=self.reindex_checkpoint, since=started)
+            )
+            db.session.commit()
+        return stats
+
+    def reindex_vocabulary_references(self, identity, vocabulary_type, ids):
+        """Reindex the records and drafts referencing the given vocabulary entries.
+
+        The records and drafts indices are used as reverse index: the fields
+        configured in ``RDM_VOCABULARY_REFERENCES`` hold the ids of the
+        referenced entries, and are kept up to date on every commit. Returns a
+        dictionary with the number of records and drafts sent for reindexing.
+        """
+        fields = current_app.config["RDM_VOCABULARY_REFERENCES"].get(
+            vocabulary_type, []
+        )
+        stats = {"records": 0, "drafts": 0}
+        if not fields or not ids:
+            return stats
+
+        query = dsl.Q(
+            "bool",
+            should=[dsl.Q("terms", **{field: list(ids)}) for field in fields],
+            minimum_should_match=1,
+        )
+        for cls, indexer, key in (
+            (self.record_cls, self.indexer, "records"),
+            (self.draft_cls, self.draft_indexer, "drafts"),
+        ):
+            search = (
+                dsl.Search(
+                    using=current_search_client,
+                    index=build_alias_name(cls.index._name),
+                )
+                .filter(query)
+                .source(False)
+            )
+            ids_to_index = [hit.meta.id for hit in search.scan()]
+            indexer.bulk_index(ids_to_index)
+            stats[key] += len(ids_to_index)
+
+        return stats
+
+    def check_index_drift(self, identity, since=None, chunk_size=None, repair=False):
+        """Compare the DB and index revisions of records and drafts.
+
+        Returns a dictionary with the ids of the records and drafts that are
+        missing from the index or whose indexed revision is older than the
+        one in the database. If ``repair`` is set, they are sent for indexing.
+        """
+        drift = {"records": [], "drafts": []}
+        for cls, indexer, key in (
+            (self.record_cls, self.indexer, "records"),
+            (self.draft_cls, self.draft_indexer, "drafts"),
+        ):
+            index = build_alias_name(cls.index._name)
+            for rows in self._iter_changed(cls.model_cls, since, chunk_size):
+                # the indexer uses the revision id as external document version
+                revisions = {
+                    str(id_): version_id - 1
+                    for id_, version_id, deleted in rows
+                    if not deleted
+                }
+                if not revisions:
+                    continue
+                search = (
+                    dsl.Search(using=current_search_client, index=index)
+                    .filter("ids", values=list(revisions))
+                    .source(False)
+                    .extra(size=len(revisions), version=True)
+                )
+                indexed = {hit.meta.id: hit.meta.version for hit in search.execute()}
+                stale = [
+                    id_
+                    for id_, revision_id in revisions.items()
+                    if indexed.get(id_, -1) < revision_id
+                ]
+                if repair:
+                    indexer.bulk_index(stale)
+                drift[key].extend(stale)
+
+        return drift
+
+    #
+    # Export
+    #
+    def export(self, identity, since=None, chunk_size=None):
+        """Iterate over all the records that the identity can read.
+
+        The records are fetched in chunks sorted on ``(updated, id)`` and
+        paginated with ``search_after``, so that neither the memory nor the
+        cost of a chunk grows with the size of the repository.
+
+        :param since: only export the records updated at or after this time.
+        :param chunk_size: number of records fetched per search request.
+        :returns: an iterator over the projections of the records.
+        """
+        # Checked before iterating, so that errors are raised right away
+        self.require_permission(identity, "search")
+        chunk_size = chunk_size or current_app.config["RDM_EXPORT_CHUNK_SIZE"]
+
+        search = self.create_search(
+            identity,
+            self.record_cls,
+            self.config.search,
+            permission_action="read",
+        )
+        if since is not None:
+            search = search.filter("range", updated={"gte": since.isoformat()})
+        search = search.sort(
+            {"updated": {"order": "asc"}}, {"id": {"order": "asc"}}
+        ).extra(size=chunk_size, track_total_hits=False)
+        return self._export_chunks(identity, search)
+
+    def _export_chunks(self, identity, search):
+        """Yield the projections of the records, one chunk at a time."""
+        cursor = None
+        while True:
+            page = search.extra(search_after=cursor) if cursor else search
+            search_result = page.execute()
+            if not search_result.hits:
+                return
+            yield from self.result_list(
+                self,
+                identity,
+                search_result,
+                links_item_tpl=self.links_item_tpl,
+            ).hits
+            cursor = list(search_result.hits[-1].meta.sort)
+
     def search_community_records(
         self, identity, community_id, params=None, search_preference=None, **kwargs
     ):
-        """Search for records published in the given community."""
+        """Search for records published in the given community.
+
+        :param community_id: the id or the slug of the community.
+        """
         self.require_permission(identity, "read")
-        current_communities.service.record_cls.pid.resolve(
-            community_id
-        )  # Checks weather community exists
+        # Checks whether the community exists, and accepts slugs
+        community_uuid = resolve_community_id(community_id)
 
         # Prepare and execute the search
         params = params or {}
@@ -146,7 +448,7 @@ class RDMRecordService(RecordService):
             search_preference,
             record_cls=self.record_cls,
             search_opts=self.config.search,
-            extra_filter=dsl.Q("term", **{"parent.communities.ids": str(community_id)}),
+            extra_filter=dsl.Q("term", **{"parent.communities.ids": community_uuid}),
             permission_action="read",
             **kwargs,
         ).execute()
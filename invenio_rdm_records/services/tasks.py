@@ -10,7 +10,12 @@
 from celery import shared_task
 from flask import current_app
 from invenio_access.permissions import system_identity
+from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_requests import current_events_service, current_requests_service
+from invenio_requests.customizations import CommentEventType
+from sqlalchemy.orm.exc import NoResultFound
 
+from invenio_rdm_records.oai import reindex_set_records
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.services.errors import EmbargoNotLiftedError
 
@@ -29,3 +34,71 @@ def update_expired_embargos():
                 f"Embargo from record with id {record['id']} was not lifted"
             )
             continue
+
+
+@shared_task(ignore_result=True)
+def reindex_vocabulary_references(vocabulary_type, ids):
+    """Reindex records and drafts referencing the given vocabulary entries."""
+    current_rdm_records.records_service.reindex_vocabulary_references(
+        system_identity, vocabulary_type, ids
+    )
+
+
+@shared_task(ignore_result=True)
+def process_bulk_queues():
+    """Index the records and drafts sent to the bulk indexing queues."""
+    service = current_rdm_records.records_service
+    service.indexer.process_bulk_queue()
+    service.draft_indexer.process_bulk_queue()
+
+
+@shared_task(ignore_result=True)
+def reindex_oai_set_records(spec):
+    """Reindex the records entering or leaving an OAI set."""
+    reindex_set_records(spec)
+
+
+@shared_task(ignore_result=True)
+def publish_accepted_submission(request_id, revision_id=None):
+    """Publish the draft of an accepted community submission.
+
+    The task can be run several times: nothing is done once the record is
+    published, even if a new draft was opened since then. If publishing
+    fails, e.g. because the draft was deleted or changed since the given
+    accepted revision, the error is added as a comment to the request.
+    """
+    service = current_rdm_records.records_service
+    request = current_requests_service.record_cls.get_record(request_id)
+    if request.status != "accepted":
+        return
+    recid = request.topic.reference_dict["record"]
+    try:
+        record = service.record_cls.pid.resolve(recid, registered_only=False)
+    except (NoResultFound, PIDDoesNotExistError):
+        # Never published
+        record = None
+    if record is not None and record.pid.is_registered():
+        return
+
+    try:
+        draft = service.draft_cls.pid.resolve(recid, registered_only=False)
+        if revision_id is not None and draft.revision_id != revision_id:
+            # Only the reviewed content of the draft can be published
+            error = "its draft was changed after the submission was accepted."
+        else:
+            service.publish(system_identity, recid)
+            return
+    except (NoResultFound, PIDDoesNotExistError):
+        error = "its draft no longer exists."
+    except Exception as e:
+        current_app.logger.exception(
+            f"Failed to publish the accepted submission {request_id}"
+        )
+        error = str(e)
+
+    current_events_service.create(
+        system_identity,
+        request_id,
+        {"payload": {"content": f"The record could not be published: {error}"}},
+        CommentEventType,
+    )
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit of work operations for RDM records services."""
+
+from contextlib import contextmanager
+
+from invenio_db import db
+from invenio_records_resources.services.uow import Operation, UnitOfWork
+from sqlalchemy.orm.exc import NoResultFound
+
+
+class ParentRecordsIndexOp(Operation):
+    """Reindex the records and drafts of a parent after a change to it.
+
+    The given record and the latest published record are indexed right away,
+    so that they are consistent when the request returns. All the other
+    records and drafts of the parent are sent to the bulk indexing queues,
+    so that the cost of the request does not depend on the number of
+    versions. The queues are processed by the ``process_bulk_queues`` task.
+    """
+
+    def __init__(self, service, record, parent):
+        """Initialize the index operation."""
+        super().__init__()
+        self._service = service
+        self._record = record
+        self._parent = parent
+
+    def _latest(self):
+        """Get the latest published record of the parent, if any."""
+        latest_id = self._record.versions.latest_id
+        if latest_id is None:
+            return None
+        if latest_id == self._record.id and not self._record.is_draft:
+            return self._record
+        try:
+            return self._service.record_cls.get_record(latest_id)
+        except NoResultFound:
+            return None
+
+    def on_commit(self, uow):
+        """Index the record and queue the other records of the parent."""
+        service = self._service
+        indexed = {(type(self._record), self._record.id)}
+        service.indexer.index(self._record)
+        latest = self._latest()
+        if latest is not None and (type(latest), latest.id) not in indexed:
+            service.indexer.index(latest)
+            indexed.add((type(latest), latest.id))
+
+        for cls, indexer in (
+            (service.record_cls, service.indexer),
+            (service.draft_cls, service.draft_indexer),
+        ):
+            model_cls = cls.model_cls
+            rows = db.session.query(model_cls.id).filter(
+                model_cls.parent_id == self._parent.id,
+                model_cls.json.isnot(None),
+            )
+            ids = [row.id for row in rows if (cls, row.id) not in indexed]
+            if ids:
+                indexer.bulk_index(ids)
+
+
+def uow_cache(uow, name):
+    """Get a cache that lives as long as the given unit of work.
+
+    The service methods and request actions executed with the same unit of
+    work use it to share the results of expensive lookups, such as draft
+    validations or resolved request receivers.
+    """
+    caches = uow.__dict__.setdefault("_rdm_caches", {})
+    return caches.setdefault(name, {})
+
+
+class BulkUnitOfWork(UnitOfWork):
+    """Unit of work grouping many service calls in one transaction.
+
+    Each call can be made in a savepoint, so that a failing call is rolled
+    back, together with its operations, without aborting the other ones.
+    """
+
+    @contextmanager
+    def savepoint(self):
+        """Roll back the changes and operations of a block if it fails."""
+        operations = len(self._operations)
+        try:
+            with self.session.begin_nested():
+                yield
+        except Exception:
+            del self._operations[operations:]
+            raise
@@ -260,7 +260,7 @@ def app_config(app_config):
             "namespace": "http://schema.datacite.org/oai/oai-1.1/",
         },
     }
-    app_config["INDEXER_DEFAULT_INDEX"] = "rdmrecords-records-record-v5.0.0"
+    app_config["INDEXER_DEFAULT_INDEX"] = "rdmrecords-records-record-v6.0.0"
     # Variable not used. We set it to silent warnings
     app_config["JSONSCHEMAS_HOST"] = "not-used"
 
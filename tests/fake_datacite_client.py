@@ -85,6 +85,13 @@ class FakeDataCiteRESTClient:
         """
         return Mock()
 
+    states = {}
+    """Remote states of the DOIs, findable if absent."""
+
+    def get_doi_state(self, doi):
+        """Get the remote state of a DOI."""
+        return self.states.get(doi, "findable")
+
     def check_doi(self, doi):
         """Check doi structure.
 
@@ -16,6 +16,7 @@ from invenio_communities.fixtures.tasks import create_demo_community
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_records_resources.proxies import current_service_registry
 from invenio_vocabularies.proxies import current_service as vocabulary_service
+from invenio_vocabularies.records.api import Vocabulary
 
 from invenio_rdm_records.fixtures import RecordsFixture, create_demo_record
 from invenio_rdm_records.fixtures.communities import CommunitiesFixture
@@ -54,6 +55,28 @@ def test_load_languages(app, db, search_clear):
     assert item.id == "aae"
 
 
+def test_bulk_load_languages(app, db, search_clear):
+    id_ = "languages"
+    languages = GenericVocabularyEntry(
+        Path(__file__).parent / "data",
+        id_,
+        {"pid-type": "lng", "data-file": "vocabularies/languages.yaml"},
+    )
+
+    app.config["RDM_VOCABULARIES_BULK_CHUNK_SIZE"] = 2
+    try:
+        languages.load(system_identity, bulk=True)
+    finally:
+        app.config["RDM_VOCABULARIES_BULK_CHUNK_SIZE"] = 1000
+
+    item = vocabulary_service.read(system_identity, (id_, "aae"))
+    assert item.id == "aae"
+
+    Vocabulary.index.refresh()
+    items = vocabulary_service.search(system_identity, type=id_)
+    assert items.total == len(list(languages.iterate(set())))
+
+
 def test_load_resource_types(app, db, search_clear):
     id_ = "resourcetypes"
     resource_types = GenericVocabularyEntry(
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN.
+#
+# Invenio-RDM-Records is free software; you can redistribute it and/or modify
+# it under the terms of the MIT License; see LICENSE file for more details.
+
+"""Tests for the timing instrumentation of the dumpers."""
+
+from invenio_records.dumpers.relations import RelationDumperExt
+
+from invenio_rdm_records.profiling import Timings
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records import RDMDraft
+from invenio_rdm_records.records.dumpers import TimedDumperExt
+from invenio_rdm_records.records.dumpers.profiling import (
+    instrument_record_cls,
+    uninstrument_record_cls,
+)
+
+
+def test_instrument_record_cls(running_app, minimal_record):
+    """Test the measurement of dumper extensions and system field hooks."""
+    service = current_rdm_records.records_service
+    item = service.create(running_app.superuser_identity, minimal_record)
+    draft = RDMDraft.pid.resolve(item.id, registered_only=False)
+    expected = draft.dumps()
+
+    timings = Timings()
+    instrument_record_cls(RDMDraft, timings)
+    # Instrumenting twice doesn't wrap the extensions twice
+    instrument_record_cls(RDMDraft, timings)
+    try:
+        exts = RDMDraft.dumper._extensions
+        assert all(isinstance(e, TimedDumperExt) for e in exts)
+        assert not any(isinstance(e.ext, TimedDumperExt) for e in exts)
+        assert draft.dumps() == expected
+    finally:
+        uninstrument_record_cls(RDMDraft)
+
+    metrics = timings.to_dict()
+    assert metrics["dumper.RelationDumperExt.dump"]["calls"] == 1
+    assert metrics["field.access.post_dump"]["calls"] == 1
+    assert metrics["field.parent.pre_dump"]["calls"] == 1
+    assert any(isinstance(e, RelationDumperExt) for e in RDMDraft.dumper._extensions)
+
+    # Uninstrumented classes are no longer measured
+    timings.reset()
+    draft.dumps()
+    assert timings.to_dict() == {}
@@ -9,6 +9,7 @@
 
 """Module tests."""
 
+import gzip
 import json
 from datetime import datetime, timedelta, timezone
 from io import BytesIO
@@ -17,6 +18,7 @@ import arrow
 import pytest
 from invenio_requests import current_requests_service
 
+from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_rdm_records.records import RDMDraft, RDMRecord
 from invenio_rdm_records.requests import CommunitySubmission
 
@@ -855,3 +857,87 @@ def test_search_community_records(
 
     res = client.get(f"/communities/{community['id']}/records", headers=headers)
     assert res.json["hits"]["total"] == 1
+
+
+def test_anonymous_search_cache(
+    running_app, client, minimal_record, headers, search_clear, mocker
+):
+    """Test the cache of the searches of anonymous users."""
+    config = running_app.app.config
+    config["RDM_SEARCH_CACHE_ENABLED"] = True
+    # The index is refreshed explicitly
+    config["RDM_SEARCH_CACHE_REFRESH_DELAY"] = 0
+    service = current_rdm_records_service
+    superuser_identity = running_app.superuser_identity
+
+    def publish():
+        draft = service.create(superuser_identity, minimal_record)
+        service.publish(superuser_identity, draft.id)
+        RDMRecord.index.refresh()
+
+    try:
+        publish()
+        search = mocker.spy(service, "search")
+        res = client.get("/records", headers=headers)
+        assert res.json["hits"]["total"] == 1
+        assert client.get("/records", headers=headers).json == res.json
+        assert search.call_count == 1
+
+        # Publishing makes the cached responses stale
+        publish()
+        assert client.get("/records", headers=headers).json["hits"]["total"] == 2
+        assert search.call_count == 2
+
+        # Responses are not cached until the index is refreshed
+        config["RDM_SEARCH_CACHE_REFRESH_DELAY"] = 60
+        publish()
+        client.get("/records", headers=headers)
+        client.get("/records", headers=headers)
+        assert search.call_count == 4
+    finally:
+        config["RDM_SEARCH_CACHE_ENABLED"] = False
+        config["RDM_SEARCH_CACHE_REFRESH_DELAY"] = 2
+
+
+def test_export(running_app, client, minimal_record, headers, search_clear):
+    """Test the streaming export of all the records."""
+    service = current_rdm_records_service
+    superuser_identity = running_app.superuser_identity
+    ids = []
+    for _ in range(3):
+        draft = service.create(superuser_identity, minimal_record)
+        ids.append(service.publish(superuser_identity, draft.id).id)
+    RDMRecord.index.refresh()
+    # Restricted records are not exported to anonymous users
+    minimal_record["access"]["record"] = "restricted"
+    draft = service.create(superuser_identity, minimal_record)
+    service.publish(superuser_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    # Records are fetched in several chunks
+    config = running_app.app.config
+    config["RDM_EXPORT_CHUNK_SIZE"] = 2
+    try:
+        res = client.get("/records/export?format=json")
+    finally:
+        config["RDM_EXPORT_CHUNK_SIZE"] = 500
+    assert res.status_code == 200
+    assert res.mimetype == "application/x-ndjson"
+    lines = res.get_data(as_text=True).splitlines()
+    assert sorted(json.loads(line)["id"] for line in lines) == sorted(ids)
+
+    res = client.get(
+        "/records/export?format=datacite-xml",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert res.headers["Content-Encoding"] == "gzip"
+    data = gzip.decompress(res.get_data()).decode("utf-8")
+    assert data.startswith("<?xml")
+    assert data.count("<?xml") == 1
+    assert data.rstrip().endswith("</records>")
+
+    since = (datetime.utcnow() + timedelta(days=1)).isoformat()
+    res = client.get(f"/records/export?format=json&since={since}")
+    assert res.get_data(as_text=True) == ""
+
+    assert client.get("/records/export?format=unknown").status_code == 400
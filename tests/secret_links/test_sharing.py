@@ -21,6 +21,7 @@ from marshmallow.exceptions import ValidationError
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.records import RDMRecord
 from invenio_rdm_records.secret_links.permissions import LinkNeed
+from invenio_rdm_records.services.tasks import process_bulk_queues
 
 
 @pytest.fixture()
@@ -212,3 +213,35 @@ def test_read_restricted_record_with_secret_link(
     res = client.get("/records", query_string={"q": f"id:{recid}"})
     assert res.status_code == 200
     assert res.json["hits"]["total"] == 0
+
+
+def test_links_reindex_versions_in_bulk(
+    running_app, service, minimal_record, identity_simple
+):
+    """Test that only the latest version is reindexed right away."""
+    config = running_app.app.config
+    draft = service.create(identity_simple, minimal_record)
+    first = service.publish(identity_simple, draft.id)
+    draft = service.new_version(identity_simple, first.id)
+    service.update_draft(identity_simple, draft.id, minimal_record)
+    latest = service.publish(identity_simple, draft.id)
+
+    config["RDM_INDEX_RELATED_RECORDS_IN_BULK"] = True
+    try:
+        link = service.secret_links.create(
+            identity_simple, latest.id, {"permission": "view"}
+        )
+    finally:
+        config["RDM_INDEX_RELATED_RECORDS_IN_BULK"] = False
+
+    def linked_ids():
+        RDMRecord.index.refresh()
+        res = service.search(
+            identity_simple,
+            params={"allversions": True, "q": f"parent.access.links.id:{link.id}"},
+        )
+        return {hit["id"] for hit in res.hits}
+
+    assert linked_ids() == {latest.id}
+    process_bulk_queues()
+    assert linked_ids() == {first.id, latest.id}
@@ -514,3 +514,18 @@ def test_update_managed_to_external(
     component.update_draft(superuser_identity, data=data, record=draft)
     assert draft.pids == ext_pids
     # note that the old pid will still exist in the db until publish time
+
+
+# PID reads
+
+
+def test_read_all(no_required_pids_service, minimal_record, location):
+    manager = no_required_pids_service.pids.pid_manager
+    provider = manager._get_provider("test", "managed")
+
+    data = minimal_record.copy()
+    data["pids"] = {"test": {"identifier": "1", "provider": "managed"}}
+    draft = RDMDraft.create(data)
+    pid = _create_managed_pid(draft, "1", provider)
+    assert manager.read_all(draft.pids) == {"test": pid}
+    assert manager.read_all({}) == {}
@@ -247,3 +247,23 @@ def test_datacite_provider_validation(record):
     ]
     assert expected == errors
     assert not success
+
+
+def test_datacite_client_pooled_session(app, mocker):
+    client = DataCiteClient("datacite")
+    other_client = DataCiteClient("datacite")
+    # one session per process and configuration
+    assert client.session is other_client.session
+    assert client.api.session is client.session
+    assert client.api.timeout == current_app.config["DATACITE_TIMEOUT"]
+
+    adapter = client.session.get_adapter("https://api.test.datacite.org/")
+    assert adapter.max_retries.total == current_app.config["DATACITE_RETRIES"]
+
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {"data": {"attributes": {"url": "https://x"}}}
+    request = mocker.patch.object(client.session, "request", return_value=response)
+    assert client.api.get_doi("10.1234/abcd") == "https://x"
+    method, url = request.call_args.args
+    assert method == "GET"
+    assert url.endswith("dois/10.1234/abcd")
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN
+#
+# Invenio-RDM-Records is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""PIDs outbox tests."""
+
+from datetime import datetime
+
+import pytest
+from invenio_pidstore.models import PIDStatus
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records.models import RDMPIDOperation
+from invenio_rdm_records.services.pids import outbox
+
+
+@pytest.fixture()
+def outbox_app(running_app):
+    """Application with the PIDs outbox enabled."""
+    config = running_app.app.config
+    config["RDM_PIDS_OUTBOX_ENABLED"] = True
+    config["RDM_PIDS_OUTBOX_RATE"] = 0
+    outbox.circuit_breaker.success()
+    yield running_app
+    config["RDM_PIDS_OUTBOX_ENABLED"] = False
+    config["RDM_PIDS_OUTBOX_RATE"] = 5
+    outbox.circuit_breaker.success()
+
+
+def test_publish_enqueues_registration(
+    outbox_app, search_clear, minimal_record, superuser_identity
+):
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+    provider = service.pids.pid_manager._get_provider("doi", "datacite")
+    assert provider.get(pid_value=doi).status == PIDStatus.RESERVED
+
+    # Repeated operations on the same DOI are deduplicated, the OAI ID is
+    # queued as well
+    outbox.enqueue(record.id, "doi")
+    assert RDMPIDOperation.query.filter_by(recid=record.id).count() == 2
+    assert outbox.metrics()["pending"] == 2
+
+    # The update of the local OAI ID succeeds without remote calls
+    assert outbox.process() == {"succeeded": 2, "failed": 0}
+    assert provider.get(pid_value=doi).status == PIDStatus.REGISTERED
+    assert outbox.metrics()["pending"] == 0
+
+
+def test_failed_operations_are_retried_later(
+    outbox_app, search_clear, minimal_record, superuser_identity, mocker
+):
+    outbox_app.app.config["RDM_PIDS_OUTBOX_CIRCUIT_THRESHOLD"] = 1
+    mocker.patch(
+        "invenio_rdm_records.services.pids.providers.datacite."
+        + "DataCitePIDProvider.register",
+        return_value=False,
+    )
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+    # Only keep the DOI operation, which fails
+    RDMPIDOperation.query.filter_by(recid=record.id, scheme="oai").delete()
+
+    try:
+        assert outbox.process() == {"succeeded": 0, "failed": 1}
+    finally:
+        outbox_app.app.config["RDM_PIDS_OUTBOX_CIRCUIT_THRESHOLD"] = 5
+
+    operation = RDMPIDOperation.query.filter_by(recid=record.id).one()
+    assert operation.attempts == 1
+    assert operation.next_attempt > datetime.utcnow()
+    assert operation.last_error
+
+    provider = service.pids.pid_manager._get_provider("doi", "datacite")
+    assert provider.get(pid_value=doi).status == PIDStatus.RESERVED
+
+    metrics = outbox.metrics()
+    assert metrics["retrying"] == 1
+    assert metrics["due"] == 0
+    # The circuit breaker stops calling the failing provider
+    assert metrics["open"] is True
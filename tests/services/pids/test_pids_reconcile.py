@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 CERN
+#
+# Invenio-RDM-Records is free software; you can redistribute it
+# and/or modify it under the terms of the MIT License; see LICENSE file for
+# more details.
+
+"""PIDs reconciliation tests."""
+
+from invenio_pidstore.models import PIDStatus
+
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.services.pids import reconcile
+
+from ...fake_datacite_client import FakeDataCiteRESTClient
+
+
+def test_reconcile_pids(
+    running_app, search_clear, minimal_record, superuser_identity, mocker
+):
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+    provider = service.pids.pid_manager._get_provider("doi", "datacite")
+    assert provider.get(pid_value=doi).status == PIDStatus.REGISTERED
+
+    stats = reconcile.reconcile(rate=0)
+    assert stats["checked"] >= 1
+    assert stats["differences"] == []
+
+    # The registration never reached the provider
+    mocker.patch.object(FakeDataCiteRESTClient, "states", {doi: None})
+    task = mocker.patch(
+        "invenio_rdm_records.services.pids.tasks.register_or_update_pid.delay"
+    )
+    stats = reconcile.reconcile(rate=0)
+    assert stats["differences"] == [{"pid": doi, "local": "REGISTERED", "remote": None}]
+    assert stats["fixed"] == 0
+    assert provider.get(pid_value=doi).status == PIDStatus.REGISTERED
+
+    stats = reconcile.reconcile(fix=True, rate=0)
+    assert stats["fixed"] == 1
+    assert provider.get(pid_value=doi).status == PIDStatus.RESERVED
+    task.assert_called_once_with(record.id, "doi")
+
+
+def test_reconcile_pids_remote_error(
+    running_app, search_clear, minimal_record, superuser_identity, mocker
+):
+    service = current_rdm_records.records_service
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+
+    # Errors of the remote provider are reported, not raised
+    mocker.patch.object(
+        FakeDataCiteRESTClient, "get_doi_state", side_effect=ConnectionError
+    )
+    stats = reconcile.reconcile(rate=0)
+    assert {"pid": doi, "local": "REGISTERED", "remote": "unknown"} in stats[
+        "differences"
+    ]
@@ -13,6 +13,7 @@ from invenio_db import db
 from invenio_oaiserver.models import OAISet
 from marshmallow import ValidationError
 
+from invenio_rdm_records.oaiserver.services.cache import oai_sets_cache
 from invenio_rdm_records.oaiserver.services.config import OAIPMHServerServiceConfig
 from invenio_rdm_records.oaiserver.services.errors import OAIPMHSetNotEditable
 from invenio_rdm_records.oaiserver.services.services import OAIPMHServerService
@@ -74,3 +75,48 @@ def test_reserved_prefixes(running_app, search_clear, minimal_oai_set):
     # Must fail as "cds-" is a reserved prefix
     with pytest.raises(ValidationError):
         service.create(superuser_identity, minimal_oai_set)
+
+
+def test_search_sets(running_app, search_clear, minimal_oai_set):
+    superuser_identity = running_app.superuser_identity
+    service = current_oaipmh_server_service
+    for spec, name in (("a_set", "First Set"), ("abset", "Second set")):
+        service.create(
+            superuser_identity, {**minimal_oai_set, "spec": spec, "name": name}
+        )
+
+    def specs(q):
+        result = service.search(superuser_identity, {"q": q, "sort": "spec"})
+        return [hit["spec"] for hit in result.to_dict()["hits"]["hits"]]
+
+    # Case insensitive substring matches, with LIKE wildcards escaped
+    assert specs("SET") == ["a_set", "abset"]
+    assert specs("a_") == ["a_set"]
+    assert specs("cond") == ["abset"]
+
+    running_app.app.config["RDM_OAI_PMH_SETS_SEARCH_PREFIX"] = True
+    try:
+        assert specs("set") == []
+        assert specs("sec") == ["abset"]
+    finally:
+        running_app.app.config["RDM_OAI_PMH_SETS_SEARCH_PREFIX"] = False
+
+
+def test_cached_reads(running_app, search_clear, minimal_oai_set):
+    superuser_identity = running_app.superuser_identity
+    service = current_oaipmh_server_service
+
+    id_ = service.create(superuser_identity, minimal_oai_set)._item.id
+    assert service.read(superuser_identity, id_).to_dict()["name"] == "name"
+    assert oai_sets_cache.get(("id", id_)) is not None
+    assert oai_sets_cache.get(("spec", "spec")) is not None
+
+    # Changes through the service invalidate the cache
+    data = {**minimal_oai_set, "name": "Updated name"}
+    service.update(superuser_identity, id_, data)
+    assert oai_sets_cache.get(("id", id_)) is None
+    assert service.read(superuser_identity, id_).to_dict()["name"] == "Updated name"
+
+    formats = service.read_all_formats(superuser_identity)
+    assert service.read_all_formats(superuser_identity).to_dict() == formats.to_dict()
+    assert service._formats[0] is running_app.app.config["OAISERVER_METADATA_FORMATS"]
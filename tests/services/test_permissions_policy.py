@@ -9,7 +9,7 @@
 
 """Permissions for Invenio RDM Records."""
 
-from flask_principal import RoleNeed, UserNeed
+from flask_principal import Identity, RoleNeed, UserNeed
 from invenio_access.permissions import (
     any_user,
     authenticated_user,
@@ -26,6 +26,10 @@ from invenio_records_permissions.generators import (
 
 from invenio_rdm_records.records import RDMParent, RDMRecord
 from invenio_rdm_records.services.generators import IfRestricted, RecordOwners
+from invenio_rdm_records.services.permissions import (
+    RDMRecordPermissionPolicy,
+    query_filters_cache,
+)
 
 
 class TestRDMPermissionPolicy(RecordPermissionPolicy):
@@ -137,3 +141,41 @@ def test_permission_policy_needs_excludes(superuser_role_need):
 
     assert updates_files_perm.needs == {superuser_role_need}
     assert updates_files_perm.excludes == {any_user}
+
+
+def test_permission_query_filters_cache(app, mocker):
+    """Test that the query filters are cached per action and needs."""
+    query_filters_cache.clear()
+    spy = mocker.spy(RecordOwners, "query_filter")
+
+    def identity(*needs):
+        identity = Identity(1)
+        identity.provides.update([authenticated_user, *needs])
+        return identity
+
+    def query_filters(action, identity):
+        policy = RDMRecordPermissionPolicy(action=action, identity=identity)
+        return policy.query_filters
+
+    filters = query_filters("read", identity(UserNeed(1)))
+    calls = spy.call_count
+    assert calls > 0
+
+    # Same needs: the filters are reused
+    cached = query_filters("read", identity(UserNeed(1)))
+    assert spy.call_count == calls
+    assert [f.to_dict() for f in cached] == [f.to_dict() for f in filters]
+
+    # The cached filters are not changed by modifying the returned ones
+    expected = [f.to_dict() for f in filters]
+    cached[0].boost = 2
+    cached.append(None)
+    cached = query_filters("read", identity(UserNeed(1)))
+    assert [f.to_dict() for f in cached] == expected
+
+    # Different action or needs: the filters are built
+    query_filters("read_files", identity(UserNeed(1)))
+    assert spy.call_count > calls
+    calls = spy.call_count
+    query_filters("read", identity(UserNeed(1), UserNeed(2)))
+    assert spy.call_count > calls
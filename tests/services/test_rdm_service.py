@@ -10,10 +10,15 @@
 """Service level tests for Invenio RDM Records."""
 
 import pytest
+from invenio_communities.proxies import current_communities
+from invenio_pidstore.errors import PIDDeletedError
 
 from invenio_rdm_records.proxies import current_rdm_records, current_rdm_records_service
 from invenio_rdm_records.records import RDMDraft, RDMRecord
+from invenio_rdm_records.services.communities import community_ids_cache
 from invenio_rdm_records.services.errors import EmbargoNotLiftedError
+from invenio_rdm_records.services.indexer import RelationsCache
+from invenio_rdm_records.services.results import communities_reader
 
 
 def test_minimal_draft_creation(running_app, search_clear, minimal_record):
@@ -186,3 +191,195 @@ def test_search_community_records(
         community_id=community.id,
     )
     assert results.to_dict()["hits"]["total"] == 2
+
+
+def test_search_community_records_by_slug(
+    running_app, search_clear, community, anyuser_identity, superuser_identity
+):
+    """Test the cached resolution of the community of a search."""
+    service = current_rdm_records_service
+    community_id = str(community.id)
+    slug = community["slug"]
+    community_ids_cache.clear()
+
+    for id_ in (community_id, slug):
+        results = service.search_community_records(anyuser_identity, id_)
+        assert results.to_dict()["hits"]["total"] == 0
+    assert community_ids_cache.get(slug) == community_id
+
+    # Deleting the community invalidates the cache
+    current_communities.service.delete(superuser_identity, community_id)
+    assert community_ids_cache.get(slug) is None
+    assert community_ids_cache.get(community_id) is None
+    with pytest.raises(PIDDeletedError):
+        service.search_community_records(anyuser_identity, slug)
+
+
+def test_search_expand_communities(
+    db, running_app, search_clear, minimal_record, community, anyuser_identity, mocker
+):
+    """Test the expansion of the communities of many records."""
+    service = current_rdm_records_service
+    community = community._record
+    for _ in range(3):
+        draft = RDMDraft.create(minimal_record)
+        draft.commit()
+        record = RDMRecord.publish(draft)
+        record.commit()
+        record.parent.communities.add(community, default=True)
+        record.parent.commit()
+        db.session.commit()
+        service.indexer.index(record)
+    RDMRecord.index.refresh()
+    communities_reader.cache.clear()
+
+    read_many = mocker.spy(current_communities.service, "read_many")
+
+    def expanded():
+        results = service.search(anyuser_identity, expand=True).to_dict()
+        return [hit["expanded"]["parent"] for hit in results["hits"]["hits"]]
+
+    hits = expanded()
+    assert len(hits) == 3
+    assert all(h["communities"]["default"]["slug"] == community.slug for h in hits)
+    # One read for the whole page, then served from the cache
+    assert read_many.call_count == 1
+    expanded()
+    assert read_many.call_count == 1
+
+
+def test_search_latest_versions(running_app, search_clear, minimal_record):
+    """Test that searches count works, unless all versions are requested."""
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    draft = service.new_version(superuser_identity, record.id)
+    service.update_draft(superuser_identity, draft.id, minimal_record)
+    latest = service.publish(superuser_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    def search(**params):
+        return service.search(superuser_identity, params=params).to_dict()
+
+    res = search()
+    assert res["hits"]["total"] == 1
+    assert [hit["id"] for hit in res["hits"]["hits"]] == [latest.id]
+    buckets = res["aggregations"]["resource_type"]["buckets"]
+    assert [b["doc_count"] for b in buckets] == [1]
+
+    res = search(allversions=True)
+    assert res["hits"]["total"] == 2
+    buckets = res["aggregations"]["resource_type"]["buckets"]
+    assert [b["doc_count"] for b in buckets] == [2]
+
+
+#
+# Incremental indexing
+#
+def test_reindex_changed(db, running_app, search_clear, minimal_record, mocker):
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(id_=draft.id, identity=superuser_identity)
+    RDMRecord.index.refresh()
+    RDMDraft.index.refresh()
+
+    # The first run reindexes everything and stores a checkpoint
+    assert service.reindex_changed_since() is None
+    stats = service.reindex_changed(superuser_identity)
+    assert stats["records"] >= 1
+    checkpoint = service.reindex_changed_since()
+    assert checkpoint is not None
+
+    # The record is stale in the index after a direct DB update
+    record = RDMRecord.pid.resolve(record["id"])
+    record.metadata["title"] = "Updated without reindexing"
+    record.commit()
+    db.session.commit()
+
+    drift = service.check_index_drift(superuser_identity)
+    assert drift["records"] == [str(record.id)]
+
+    # The checkpoint is kept if the reindexing fails
+    mocker.patch.object(service.indexer, "bulk_index", side_effect=RuntimeError("down"))
+    with pytest.raises(RuntimeError):
+        service.reindex_changed(superuser_identity)
+    assert service.reindex_changed_since() == checkpoint
+    mocker.stopall()
+
+    stats = service.reindex_changed(superuser_identity)
+    assert stats == {"records": 1, "drafts": 0}
+    assert service.reindex_changed_since() > checkpoint
+
+
+def test_check_index_drift_repair(running_app, search_clear, minimal_record):
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+
+    draft = service.create(superuser_identity, minimal_record)
+    service.publish(id_=draft.id, identity=superuser_identity)
+    RDMRecord.index.refresh()
+    RDMDraft.index.refresh()
+
+    drift = service.check_index_drift(superuser_identity)
+    assert drift == {"records": [], "drafts": []}
+
+
+#
+# Bulk indexing
+#
+def test_bulk_index_dereferences_relations(running_app, search_clear, minimal_record):
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+    minimal_record["metadata"]["languages"] = [{"id": "eng"}]
+
+    ids = []
+    for _ in range(3):
+        draft = service.create(superuser_identity, minimal_record)
+        record = service.publish(id_=draft.id, identity=superuser_identity)
+        ids.append(record._record.id)
+
+    cache = RelationsCache()
+    cache.prefetch(RDMRecord.get_records(ids))
+    assert set(cache._cache["languages"]) == {"eng"}
+
+    # The relation fields use their own cache again after the chunk
+    field = RDMRecord.relations._fields["languages"]
+    previous = field._cache_ref
+    service.indexer.bulk_index(ids)
+    assert service.indexer.process_bulk_queue() == (3, 0)
+    assert field._cache_ref is previous
+    RDMRecord.index.refresh()
+
+    res = service.search(superuser_identity, q="metadata.languages.id:eng")
+    assert res.total == 3
+    for hit in res.hits:
+        assert hit["metadata"]["languages"] == [
+            {"id": "eng", "title": {"en": "English", "da": "Engelsk"}}
+        ]
+
+
+#
+# Components tracing
+#
+def test_component_tracing(running_app, search_clear, minimal_record):
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+    service.component_timings.reset()
+
+    draft = service.create(superuser_identity, minimal_record)
+    assert service.component_timings.to_dict() == {}
+
+    running_app.app.config["RDM_SERVICE_TRACING_SAMPLE_RATE"] = 1
+    try:
+        service.publish(id_=draft.id, identity=superuser_identity)
+    finally:
+        running_app.app.config["RDM_SERVICE_TRACING_SAMPLE_RATE"] = 0
+
+    timings = service.component_timings.to_dict()
+    assert timings["publish.PIDsComponent"]["calls"] == 1
+    assert timings["publish.MetadataComponent"]["calls"] == 1
+    assert all(name.startswith("publish.") for name in timings)
@@ -14,8 +14,12 @@ from invenio_communities import current_communities
 from invenio_communities.communities.records.api import Community
 from invenio_communities.generators import CommunityRoleNeed
 from invenio_communities.members.records.api import Member
+from invenio_drafts_resources.services.records.service import (
+    RecordService as DraftsRecordService,
+)
 from invenio_records_resources.services.errors import PermissionDeniedError
-from invenio_requests import current_requests_service
+from invenio_records_resources.services.uow import UnitOfWork
+from invenio_requests import current_events_service, current_requests_service
 from marshmallow.exceptions import ValidationError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -28,6 +32,7 @@ from invenio_rdm_records.services.errors import (
     ReviewNotFoundError,
     ReviewStateError,
 )
+from invenio_rdm_records.services.tasks import publish_accepted_submission
 
 
 def get_community_owner_identity(community):
@@ -477,3 +482,201 @@ def test_review_gives_access_to_curator(running_app, draft, service, requests_se
 # - Test: submit to restricted community not allowed by user
 #         (likely requires members structure in communities?)
 # - Test: That another user cannot e.g. read reviews service.reviews.read
+
+
+def test_bulk_accept(minimal_record, running_app, community, service, db):
+    """Test accepting many review requests at once."""
+    superuser_identity = running_app.superuser_identity
+    minimal_record["parent"] = {
+        "review": {
+            "type": "community-submission",
+            "receiver": {"community": community.data["id"]},
+        }
+    }
+    drafts, requests = [], []
+    for _ in range(3):
+        draft = service.create(superuser_identity, minimal_record)
+        drafts.append(draft)
+        requests.append(service.review.submit(superuser_identity, draft.id).id)
+
+    # The last draft can't be published anymore
+    data = service.read_draft(superuser_identity, drafts[-1].id).data
+    del data["metadata"]["title"]
+    service.update_draft(superuser_identity, drafts[-1].id, data)
+
+    running_app.app.config["RDM_REVIEW_BULK_CHUNK_SIZE"] = 2
+    try:
+        results = service.review.bulk_execute_action(
+            superuser_identity, "accept", requests + ["not-a-request"]
+        )
+    finally:
+        running_app.app.config["RDM_REVIEW_BULK_CHUNK_SIZE"] = 50
+
+    assert [r["id"] for r in results] == requests + ["not-a-request"]
+    assert [r.get("status") for r in results] == ["accepted", "accepted", None, None]
+    assert "error" in results[2] and "error" in results[3]
+
+    for draft in drafts[:2]:
+        record = service.read(superuser_identity, draft.id).to_dict()
+        assert record["parent"]["communities"]["ids"] == [community.data["id"]]
+    req = current_requests_service.read(superuser_identity, requests[2]).to_dict()
+    assert req["status"] == "submitted"
+
+    with pytest.raises(ValidationError):
+        service.review.bulk_execute_action(superuser_identity, "cancel", requests)
+
+
+def test_bulk_accept_unexpected_error(draft, running_app, service, mocker):
+    """Test that any error of a request is reported in its result."""
+    superuser_identity = running_app.superuser_identity
+    req = service.review.submit(superuser_identity, draft.id).to_dict()
+
+    mocker.patch.object(
+        type(current_requests_service),
+        "execute_action",
+        side_effect=RuntimeError("boom"),
+    )
+    results = service.review.bulk_execute_action(
+        superuser_identity, "accept", [req["id"]]
+    )
+    assert results == [{"id": req["id"], "error": "boom"}]
+
+
+def test_accept_async_publish(draft, running_app, service, requests_service, mocker):
+    """Test publishing an accepted submission in the background."""
+    superuser_identity = running_app.superuser_identity
+    config = running_app.app.config
+    req = service.review.submit(superuser_identity, draft.id).to_dict()
+
+    delay = mocker.patch.object(publish_accepted_submission, "delay")
+    config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = True
+    try:
+        req = requests_service.execute_action(
+            superuser_identity, req["id"], "accept", {}
+        ).to_dict()
+    finally:
+        config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = False
+    assert req["status"] == "accepted"
+    revision_id = service.draft_cls.pid.resolve(
+        draft.id, registered_only=False
+    ).revision_id
+    delay.assert_called_once_with(req["id"], revision_id)
+
+    # The draft is in the community, but not published yet
+    unpublished = service.read_draft(superuser_identity, draft.id).to_dict()
+    assert unpublished["parent"]["communities"]["ids"]
+    assert unpublished["is_published"] is False
+
+    publish_accepted_submission(req["id"], revision_id)
+    record = service.read(superuser_identity, draft.id).to_dict()
+    assert record["is_published"] is True
+
+    # Publishing again does nothing, even once a new draft is opened
+    data = service.edit(superuser_identity, draft.id).data
+    data["metadata"]["title"] = "Unreviewed"
+    service.update_draft(superuser_identity, draft.id, data)
+    publish_accepted_submission(req["id"], revision_id)
+    record = service.read(superuser_identity, draft.id).to_dict()
+    assert record["metadata"]["title"] != "Unreviewed"
+
+
+def test_accept_async_publish_deleted_draft(
+    draft, running_app, service, requests_service, mocker
+):
+    """Test that a deleted draft is reported on the accepted submission."""
+    superuser_identity = running_app.superuser_identity
+    config = running_app.app.config
+    req = service.review.submit(superuser_identity, draft.id).to_dict()
+
+    mocker.patch.object(publish_accepted_submission, "delay")
+    config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = True
+    try:
+        req = requests_service.execute_action(
+            superuser_identity, req["id"], "accept", {}
+        ).to_dict()
+    finally:
+        config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = False
+    service.delete_draft(superuser_identity, draft.id)
+
+    comment = mocker.spy(current_events_service, "create")
+    publish_accepted_submission(req["id"])
+    comment.assert_called_once()
+
+
+def test_accept_async_publish_changed_draft(
+    draft, running_app, service, requests_service, mocker
+):
+    """Test that a draft changed after its acceptance is not published."""
+    superuser_identity = running_app.superuser_identity
+    config = running_app.app.config
+    req = service.review.submit(superuser_identity, draft.id).to_dict()
+
+    delay = mocker.patch.object(publish_accepted_submission, "delay")
+    config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = True
+    try:
+        req = requests_service.execute_action(
+            superuser_identity, req["id"], "accept", {}
+        ).to_dict()
+    finally:
+        config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = False
+    data = service.read_draft(superuser_identity, draft.id).data
+    data["metadata"]["title"] = "Unreviewed"
+    service.update_draft(superuser_identity, draft.id, data)
+
+    comment = mocker.spy(current_events_service, "create")
+    publish_accepted_submission(*delay.call_args.args)
+    comment.assert_called_once()
+    content = comment.call_args.args[2]["payload"]["content"]
+    assert "changed after the submission was accepted" in content
+    unpublished = service.read_draft(superuser_identity, draft.id).to_dict()
+    assert unpublished["is_published"] is False
+
+
+def test_accept_async_publish_permission(
+    draft, running_app, service, requests_service, mocker
+):
+    """Test that the accepting identity must be allowed to publish."""
+    superuser_identity = running_app.superuser_identity
+    config = running_app.app.config
+    req = service.review.submit(superuser_identity, draft.id).to_dict()
+
+    delay = mocker.patch.object(publish_accepted_submission, "delay")
+    mocker.patch.object(
+        type(service),
+        "require_permission",
+        side_effect=PermissionDeniedError("publish"),
+    )
+    config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = True
+    try:
+        with pytest.raises(PermissionDeniedError):
+            requests_service.execute_action(superuser_identity, req["id"], "accept", {})
+    finally:
+        config["RDM_COMMUNITY_SUBMISSION_ASYNC_PUBLISH"] = False
+    delay.assert_not_called()
+
+
+def test_accept_validates_once(
+    db, draft, running_app, service, requests_service, mocker
+):
+    """Test that an accepted draft is not validated again when published."""
+    superuser_identity = running_app.superuser_identity
+    req = service.review.submit(superuser_identity, draft.id).to_dict()
+
+    validate = mocker.spy(DraftsRecordService, "_validate_draft")
+    req = requests_service.execute_action(
+        superuser_identity, req["id"], "accept", {}
+    ).to_dict()
+    assert req["status"] == "accepted"
+    assert validate.call_count == 1
+
+
+def test_submit_validates_once(db, draft, running_app, service, mocker):
+    """Test that a submitted draft is validated once per unit of work."""
+    superuser_identity = running_app.superuser_identity
+    validate = mocker.spy(DraftsRecordService, "_validate_draft")
+    with UnitOfWork(db.session) as uow:
+        service._validate_draft(superuser_identity, draft._record, uow=uow)
+        req = service.review.submit(superuser_identity, draft.id, uow=uow)
+        uow.commit()
+    assert req.to_dict()["status"] == "submitted"
+    assert validate.call_count == 1
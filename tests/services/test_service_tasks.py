@@ -11,7 +11,11 @@ import pytest
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.records.api import RDMDraft
-from invenio_rdm_records.services.tasks import update_expired_embargos
+from invenio_rdm_records.services.components import VocabularyReferencesComponent
+from invenio_rdm_records.services.tasks import (
+    reindex_vocabulary_references,
+    update_expired_embargos,
+)
 
 
 def test_embargo_lift_without_draft(embargoed_record, running_app, search_clear):
@@ -78,3 +82,46 @@ def test_embargo_lift_with_updated_draft(
     assert draft_lifted.access.embargo.active is False
     assert draft_lifted.access.protection.files == "restricted"
     assert draft_lifted.access.protection.record == "public"
+
+
+def test_reindex_vocabulary_references(
+    running_app, search_clear, minimal_record, superuser_identity
+):
+    service = current_rdm_records.records_service
+    minimal_record["metadata"]["languages"] = [{"id": "eng"}]
+    draft = service.create(superuser_identity, minimal_record)
+    service.publish(id_=draft.id, identity=superuser_identity)
+    service.create(superuser_identity, minimal_record)
+    service.record_cls.index.refresh()
+    service.draft_cls.index.refresh()
+
+    stats = service.reindex_vocabulary_references(
+        superuser_identity, "languages", ["eng"]
+    )
+    assert stats == {"records": 1, "drafts": 1}
+
+    stats = service.reindex_vocabulary_references(
+        superuser_identity, "languages", ["dan"]
+    )
+    assert stats == {"records": 0, "drafts": 0}
+
+    # unknown vocabulary types don't reference any record
+    reindex_vocabulary_references("unknown", ["eng"])
+
+
+def test_vocabulary_references_component(running_app):
+    vocabularies = running_app.app.extensions["invenio-vocabularies"]
+    for service in (
+        vocabularies.service,
+        vocabularies.affiliations_service,
+        vocabularies.funders_service,
+    ):
+        assert VocabularyReferencesComponent in service.config.components
+
+    # The config classes of the vocabularies are left untouched
+    config_cls = vocabularies.funders_service.config
+    assert VocabularyReferencesComponent not in config_cls.__bases__[0].components
+
+    # Registering the component again has no effect
+    running_app.app.extensions["invenio-rdm-records"].init_vocabularies(running_app.app)
+    assert vocabularies.funders_service.config is config_cls
@@ -10,9 +10,24 @@
 
 from copy import deepcopy
 
+import pytest
+from flask import g
+from invenio_access.permissions import system_identity
+from invenio_search import RecordsSearch
 from lxml import etree
 
-from invenio_rdm_records.oai import datacite_etree, dublincore_etree, oai_datacite_etree
+from invenio_rdm_records.oai import (
+    datacite_etree,
+    dublincore_etree,
+    find_sets_for_record,
+    get_records,
+    getrecords_fetcher,
+    oai_datacite_etree,
+    set_records_query_fetcher,
+)
+from invenio_rdm_records.proxies import current_rdm_records
+from invenio_rdm_records.records import RDMRecord
+from invenio_rdm_records.records.dumpers import oai as oai_dumpers
 
 # This tests would ideally be E2E. However, due to the lack of assets building
 # in tests we cannot safely query the `/oai2d` endpoint, it will fail due to
@@ -226,3 +241,168 @@ def test_oai_datacite_serializer(running_app, full_record):
     record = {"_source": full_record}
     ser_rec = etree.tostring(oai_datacite_etree(None, record), pretty_print=True)
     assert expected_value == ser_rec.decode("utf-8")
+
+
+@pytest.fixture()
+def search_after_app(running_app):
+    """Application paginating the OAI-PMH records with search_after."""
+    config = running_app.app.config
+    previous = {
+        k: config.get(k)
+        for k in (
+            "RDM_OAI_PMH_SEARCH_AFTER",
+            "OAISERVER_SEARCH_CLS",
+            "OAISERVER_LAST_UPDATE_KEY",
+            "OAISERVER_PAGE_SIZE",
+        )
+    }
+    config.update(
+        {
+            "RDM_OAI_PMH_SEARCH_AFTER": True,
+            "OAISERVER_SEARCH_CLS": "invenio_rdm_records.oai:OAIRecordSearch",
+            "OAISERVER_LAST_UPDATE_KEY": "updated",
+            "OAISERVER_PAGE_SIZE": 2,
+        }
+    )
+    yield running_app
+    config.update(previous)
+
+
+def test_get_records_search_after(
+    search_after_app, search_clear, minimal_record, superuser_identity
+):
+    service = current_rdm_records.records_service
+    for _ in range(3):
+        draft = service.create(superuser_identity, minimal_record)
+        service.publish(superuser_identity, draft.id)
+    RDMRecord.index.refresh()
+
+    first = get_records()
+    assert first.total == 3
+    assert first.has_next
+    ids = [item["id"] for item in first.items]
+    assert len(ids) == 2
+
+    # The cursor is carried by the resumption token
+    token = {"page": first.next_num, "scroll_id": first._scroll_id}
+    second = get_records(resumptionToken=token)
+    assert not second.has_next
+    assert second._scroll_id is None
+    ids += [item["id"] for item in second.items]
+    assert len(set(ids)) == 3
+
+
+def test_get_records_search_after_resumed_filters(
+    search_after_app, search_clear, minimal_record, superuser_identity
+):
+    service = current_rdm_records.records_service
+    records = []
+    for _ in range(5):
+        draft = service.create(superuser_identity, minimal_record)
+        records.append(service.publish(superuser_identity, draft.id).to_dict())
+    RDMRecord.index.refresh()
+    from_ = records[2]["updated"]
+    expected = {record["id"] for record in records[2:]}
+
+    first = get_records(from_=from_)
+    assert first.total == 3
+    assert first.has_next
+
+    # Resumed requests only carry the filters in the resumption token
+    token = {"page": first.next_num, "scroll_id": first._scroll_id, "from_": from_}
+    second = get_records(resumptionToken=token)
+    assert second.total == 3
+    assert not second.has_next
+    ids = [item["json"]["_source"]["id"] for item in first.items]
+    ids += [item["json"]["_source"]["id"] for item in second.items]
+    assert set(ids) == expected
+
+
+def test_precomputed_sets(
+    running_app, search_clear, minimal_record, minimal_oai_set, superuser_identity
+):
+    config = running_app.app.config
+    config["RDM_OAI_PMH_PRECOMPUTED_SETS"] = True
+    try:
+        current_rdm_records.oaipmh_server_service.create(
+            system_identity, minimal_oai_set
+        )
+        service = current_rdm_records.records_service
+        draft = service.create(superuser_identity, minimal_record)
+        record = service.publish(superuser_identity, draft.id)
+        RDMRecord.index.refresh()
+
+        hit = (
+            RecordsSearch(index=RDMRecord.index.search_alias)
+            .filter(set_records_query_fetcher(minimal_oai_set["spec"]))
+            .execute()
+            .hits[0]
+        )
+        assert hit.id == record.id
+        assert find_sets_for_record(hit.to_dict()) == [minimal_oai_set["spec"]]
+        # Not stored in the record
+        assert "oai_sets" not in service.read(superuser_identity, record.id).data
+    finally:
+        config["RDM_OAI_PMH_PRECOMPUTED_SETS"] = False
+
+
+def test_precomputed_sets_bulk_index(
+    running_app,
+    search_clear,
+    minimal_record,
+    minimal_oai_set,
+    superuser_identity,
+    mocker,
+):
+    config = running_app.app.config
+    config["RDM_OAI_PMH_PRECOMPUTED_SETS"] = True
+    try:
+        current_rdm_records.oaipmh_server_service.create(
+            system_identity, minimal_oai_set
+        )
+        service = current_rdm_records.records_service
+        ids = []
+        for _ in range(3):
+            draft = service.create(superuser_identity, minimal_record)
+            ids.append(service.publish(superuser_identity, draft.id)._record.id)
+
+        # The records of a chunk are matched with the sets all at once
+        percolate = mocker.spy(oai_dumpers, "sets_search_all")
+        service.indexer.bulk_index(ids)
+        service.indexer.process_bulk_queue()
+        RDMRecord.index.refresh()
+        assert percolate.call_count == 1
+
+        hits = (
+            RecordsSearch(index=RDMRecord.index.search_alias)
+            .filter(set_records_query_fetcher(minimal_oai_set["spec"]))
+            .execute()
+        )
+        assert hits.hits.total["value"] == 3
+    finally:
+        config["RDM_OAI_PMH_PRECOMPUTED_SETS"] = False
+
+
+def test_getrecords_fetcher(
+    running_app, search_clear, minimal_record, superuser_identity, mocker
+):
+    service = current_rdm_records.records_service
+    restricted_record = deepcopy(minimal_record)
+    restricted_record["access"]["record"] = "restricted"
+    restricted_record["access"]["files"] = "restricted"
+    ids = []
+    for data in (minimal_record, restricted_record):
+        draft = service.create(superuser_identity, data)
+        ids.append(service.publish(superuser_identity, draft.id)._record.id)
+    RDMRecord.index.refresh()
+
+    read = mocker.spy(service, "read")
+    with running_app.app.test_request_context():
+        g.identity = superuser_identity
+        public, restricted = getrecords_fetcher(ids)
+
+    # Only the restricted record is read through the service
+    assert read.call_count == 1
+    assert public["uuid"] == str(ids[0])
+    assert public["access"]["record"] == "public"
+    assert restricted["access"]["record"] == "restricted"